@@ -47,9 +47,11 @@ def _sanitize_project(proj: dict) -> dict:
     return copy
 
 
-def _sanitize_items(items: list[dict] | None) -> list[dict]:
+def _sanitize_items(items: list[dict] | None, doc_type: str | None = None) -> list[dict]:
     sanitized: list[dict] = []
     for it in items or []:
+        if doc_type and (it.get("doc_type") or "").lower() != doc_type:
+            continue
         entry = dict(it)
         for key in ["saved_path", "text_path", "local_text_path", "local_pdf_path"]:
             entry.pop(key, None)
@@ -315,9 +317,7 @@ def year_view(sid: str, year: str):
         data = {"items": []}
     items = data.get("items", [])
     doc_filter = (request.args.get("doc_type") or "").strip().lower() or None
-    if doc_filter:
-        items = [it for it in items if (it.get("doc_type") or "").lower() == doc_filter]
-    sanitized_items = _sanitize_items(items)
+    sanitized_items = _sanitize_items(items, doc_filter)
     return render_template_string(YEAR_TMPL, sid=sid, year=year, items=sanitized_items, current_filter=doc_filter)
 
 @app.route("/raw/<sid>/<year>")
@@ -10,10 +10,12 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse, parse_qs
 
 import yaml
@@ -49,6 +51,14 @@ try:  # pragma: no cover - optional dependency
 except ImportError:  # pragma: no cover
     dateparser = None
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+YEAR_PREFIX_RE = re.compile(r"\d{4}")
+MEETING_SLUG_DATE_RE = re.compile(r"^\d{8}")
 DATE_WITH_SEPARATORS_RE = re.compile(r"(20\d{2})[-_/](\d{1,2})[-_/](\d{1,2})")
 DATE_CONTIGUOUS_RE = re.compile(r"(20\d{2})(\d{2})(\d{2})")
 US_NUMERIC_RE = re.compile(r"(\d{1,2})[/-](\d{1,2})[/-](20\d{2})")
@@ -61,6 +71,9 @@ DAY_MONTH_NAME_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Detail pages are independent HTTP fetches; keep the fan-out small to stay polite.
+DETAIL_SCRAPE_WORKERS = 4
+
 MONTH_MAP = {
     "jan": 1,
     "feb": 2,
@@ -92,7 +105,7 @@ def is_meeting_detail_url(url: str) -> bool:
     parts = [p for p in parsed.path.split('/') if p]
     if len(parts) < 4 or parts[0] != 'meetings':
         return False
-    return bool(re.match(r'^\d{8}', parts[-1]))
+    return bool(MEETING_SLUG_DATE_RE.match(parts[-1]))
 
 
 def _coerce_iso_date(year: int, month: int, day: int) -> Optional[str]:
@@ -169,12 +182,9 @@ def normalize_meeting_date(value: Optional[str]) -> Optional[str]:
     if not value:
         return None
     value = value.strip()
-    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", value):
-        try:
-            year, month, day = (int(value[0:4]), int(value[5:7]), int(value[8:10]))
-        except ValueError:
-            return None
-        return _coerce_iso_date(year, month, day)
+    m = ISO_DATE_RE.fullmatch(value)
+    if m:
+        return _coerce_iso_date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
     return extract_date_from_text(value)
 
 
@@ -191,7 +201,7 @@ def determine_item_year(item: Dict[str, Any]) -> str:
             return candidate[:4]
 
     collected = item.get("date_collected") or ""
-    if collected and re.match(r"\d{4}", collected):
+    if collected and YEAR_PREFIX_RE.match(collected):
         return collected[:4]
 
     return datetime.now().strftime("%Y")
@@ -216,7 +226,7 @@ def enrich_item_metadata(item: Dict[str, Any]) -> Tuple[str, List[str]]:
 
     meeting_date = item.get("meeting_date")
     collected = item.get("date_collected") or ""
-    if meeting_date and collected and re.match(r"\d{4}", collected):
+    if meeting_date and collected and YEAR_PREFIX_RE.match(collected):
         try:
             meeting_year = int(meeting_date[:4])
             collected_year = int(collected[:4])
@@ -264,17 +274,17 @@ def load_sources(config_path: Path = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
 # Removed seen-links persistence for simplified MVP
 
 
-def is_match(url: str, title: str, patterns: List[str]) -> bool:
-    s = f"{title} {url}".lower()
+@lru_cache(maxsize=64)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Tuple[Tuple[Optional[re.Pattern[str]], str], ...]:
+    """Turn sources.yaml patterns into (regex, substring) matchers once per pattern list."""
+    compiled: List[Tuple[Optional[re.Pattern[str]], str]] = []
     for pat in patterns:
         if not pat:
             continue
         # Regex-style if wrapped with /.../
         if isinstance(pat, str) and pat.startswith("/") and pat.endswith("/"):
             try:
-                rx = re.compile(pat[1:-1], re.I)
-                if rx.search(s):
-                    return True
+                compiled.append((re.compile(pat[1:-1], re.I), ""))
             except re.error:
                 pass
             continue
@@ -283,15 +293,25 @@ def is_match(url: str, title: str, patterns: List[str]) -> bool:
             regex_like = any(tok in pat for tok in ["\\", "^", "$", "[", "(", "|"])
             if regex_like:
                 try:
-                    rx = re.compile(pat, re.I)
-                    if rx.search(s):
-                        return True
+                    compiled.append((re.compile(pat, re.I), ""))
                     continue
                 except re.error:
                     # Fall back to substring
                     pass
-            if pat.lower() in s:
+            compiled.append((None, pat.lower()))
+    return tuple(compiled)
+
+
+def is_match(url: str, title: str, patterns: List[str]) -> bool:
+    s = f"{title} {url}".lower()
+    # Non-string entries (numbers, nulls, lists from YAML) never match; dropping
+    # them here also keeps the cache key hashable
+    for rx, needle in _compile_patterns(tuple(p for p in patterns if isinstance(p, str))):
+        if rx is not None:
+            if rx.search(s):
                 return True
+        elif needle in s:
+            return True
     return False
 
 
@@ -419,14 +439,71 @@ def save_year_store(
             "root_url": root_url,
             "items": sort_items_for_storage(items),
         }
-        with open(path, "w") as f:
-            json.dump(payload, f, indent=2)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w") as f:
+                json.dump(payload, f, indent=2)
         saved[str(year)] = path
     return saved
 
 
 
 
+def make_discovered_item(
+    sid: str,
+    name: str,
+    root_url: str,
+    abs_url: str,
+    title: str,
+    collected_at: str,
+    *,
+    doc_type: Optional[str] = None,
+    default_filename: str = "document.pdf",
+    **meeting: Any,
+) -> Dict[str, Any]:
+    """Build the raw-store record for a link kept by one of the collectors.
+
+    ``sid``/``name``/``root_url`` are resolved once per collector run by the caller.
+    Extra keyword arguments (meeting_url/meeting_title/meeting_date) are appended as-is.
+    """
+    item = {
+        "url": abs_url,
+        "filename": Path(urlparse(abs_url).path).name or default_filename,
+        "title": title,
+        "source": sid,
+        "source_name": name,
+        "root_url": root_url,
+        "date_collected": collected_at,
+        "status": "discovered",
+        "http_status": "discovered",
+        "seen_before": False,
+        "doc_type": doc_type or classify_doc_type(sid, abs_url, title),
+    }
+    item.update(meeting)
+    return item
+
+
+def scrape_meeting_details(
+    detail_pages: List[str], logger: logging.Logger, label: str
+) -> List[Tuple[str, Optional[List[Dict[str, Any]]]]]:
+    """Scrape meeting detail pages concurrently, returning (url, attachments) in input order.
+
+    Attachments are None when the scrape raised, so callers can count only fetched pages.
+    """
+    def _scrape(detail: str) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+        try:
+            return detail, scrape_dia_meeting_detail(detail)
+        except Exception as e:
+            logger.warning(f"{label} detail scrape failed: {detail} err={e}")
+            return detail, None
+
+    if not detail_pages:
+        return []
+    with ThreadPoolExecutor(max_workers=min(DETAIL_SCRAPE_WORKERS, len(detail_pages))) as pool:
+        return list(pool.map(_scrape, detail_pages))
+
+
 def _collect_ddrb(source: Dict[str, Any], session: HttpRetrySession, logger: logging.Logger) -> Dict[str, Any]:
     name = source.get("name") or source.get("id") or "unknown"
     sid = source.get("id") or slugify(name)
@@ -436,6 +513,7 @@ def _collect_ddrb(source: Dict[str, Any], session: HttpRetrySession, logger: log
         u = source.get("url")
         candidates = [u] if u else []
     patterns = source.get("patterns") or []
+    collected_at = datetime.now().isoformat()
 
     discovered: List[Dict[str, Any]] = []
     pages_fetched = 0
@@ -477,20 +555,7 @@ def _collect_ddrb(source: Dict[str, Any], session: HttpRetrySession, logger: log
                     continue
                 if patterns and not is_match(abs_url, title, patterns):
                     continue
-                filename = Path(urlparse(abs_url).path).name or 'document.pdf'
-                discovered.append({
-                    "url": abs_url,
-                    "filename": filename,
-                    "title": title,
-                    "source": sid,
-                    "source_name": name,
-                    "root_url": root_url,
-                    "date_collected": datetime.now().isoformat(),
-                    "status": "discovered",
-                    "http_status": "discovered",
-                    "seen_before": False,
-                    "doc_type": classify_doc_type(sid, abs_url, title),
-                })
+                discovered.append(make_discovered_item(sid, name, root_url, abs_url, title, collected_at))
                 local_seen.add(abs_url)
                 continue
             if lu.startswith("http") and "dia.jacksonville.gov" in lu and is_meeting_detail_url(abs_url):
@@ -500,14 +565,10 @@ def _collect_ddrb(source: Dict[str, Any], session: HttpRetrySession, logger: log
     logger.info(f"DDRB: following {len(meeting_pages)} meeting detail page(s)")
 
     # 2) Follow each meeting detail page to collect agenda/minutes/packet links
-    for detail in meeting_pages:
-        try:
-            atts = scrape_dia_meeting_detail(detail)
-            pages_fetched += 1
-        except Exception as e:
-            logger.warning(f"DDRB detail scrape failed: {detail} err={e}")
-            atts = []
-        for att in atts:
+    scraped = scrape_meeting_details(meeting_pages, logger, "DDRB")
+    pages_fetched += sum(1 for _, atts in scraped if atts is not None)
+    for detail, atts in scraped:
+        for att in atts or []:
             abs_url = att.get("url")
             title = att.get("title") or ""
             if not abs_url or abs_url in local_seen:
@@ -516,23 +577,13 @@ def _collect_ddrb(source: Dict[str, Any], session: HttpRetrySession, logger: log
                 continue
             if patterns and not is_match(abs_url, title, patterns):
                 continue
-            filename = Path(urlparse(abs_url).path).name or 'document.pdf'
-            discovered.append({
-                "url": abs_url,
-                "filename": filename,
-                "title": title,
-                "source": sid,
-                "source_name": name,
-                "root_url": root_url,
-                "date_collected": datetime.now().isoformat(),
-                "status": "discovered",
-                "http_status": "discovered",
-                "seen_before": False,
-                "doc_type": att.get("doc_type") or classify_doc_type(sid, abs_url, title),
-                "meeting_url": detail,
-                "meeting_title": att.get("meeting_title"),
-                "meeting_date": att.get("meeting_date"),
-            })
+            discovered.append(make_discovered_item(
+                sid, name, root_url, abs_url, title, collected_at,
+                doc_type=att.get("doc_type"),
+                meeting_url=detail,
+                meeting_title=att.get("meeting_title"),
+                meeting_date=att.get("meeting_date"),
+            ))
             local_seen.add(abs_url)
 
     return {
@@ -551,6 +602,7 @@ def _collect_dia_board(source: Dict[str, Any], session: HttpRetrySession, logger
         u = source.get("url")
         candidates = [u] if u else []
     patterns = source.get("patterns") or []
+    collected_at = datetime.now().isoformat()
 
     discovered: List[Dict[str, Any]] = []
     pages_fetched = 0
@@ -588,20 +640,7 @@ def _collect_dia_board(source: Dict[str, Any], session: HttpRetrySession, logger
                 keep = is_match(abs_url, title, patterns) if patterns else True
                 if not keep:
                     continue
-                filename = Path(urlparse(abs_url).path).name or 'document.pdf'
-                discovered.append({
-                    "url": abs_url,
-                    "filename": filename,
-                    "title": title,
-                    "source": sid,
-                    "source_name": name,
-                    "root_url": root_url,
-                    "date_collected": datetime.now().isoformat(),
-                    "status": "discovered",
-                    "http_status": "discovered",
-                    "seen_before": False,
-                    "doc_type": classify_doc_type(sid, abs_url, title),
-                })
+                discovered.append(make_discovered_item(sid, name, root_url, abs_url, title, collected_at))
                 local_seen.add(abs_url)
                 continue
             # Collect meeting detail pages within dia.jacksonville.gov
@@ -612,14 +651,10 @@ def _collect_dia_board(source: Dict[str, Any], session: HttpRetrySession, logger
     logger.info(f"DIA Board: following {len(meeting_pages)} meeting detail page(s)")
 
     # 2) Follow each meeting detail page to collect agenda/minutes/packet links
-    for detail in meeting_pages:
-        try:
-            atts = scrape_dia_meeting_detail(detail)
-            pages_fetched += 1  # one fetch per detail page inside scraper
-        except Exception as e:
-            logger.warning(f"DIA Board detail scrape failed: {detail} err={e}")
-            atts = []
-        for att in atts:
+    scraped = scrape_meeting_details(meeting_pages, logger, "DIA Board")
+    pages_fetched += sum(1 for _, atts in scraped if atts is not None)  # one fetch per detail page inside scraper
+    for detail, atts in scraped:
+        for att in atts or []:
             abs_url = att.get("url")
             title = att.get("title") or ""
             if not abs_url or abs_url in local_seen:
@@ -627,23 +662,13 @@ def _collect_dia_board(source: Dict[str, Any], session: HttpRetrySession, logger
             keep = is_match(abs_url, title, patterns) if patterns else True
             if not keep:
                 continue
-            filename = Path(urlparse(abs_url).path).name or 'document.pdf'
-            discovered.append({
-                "url": abs_url,
-                "filename": filename,
-                "title": title,
-                "source": sid,
-                "source_name": name,
-                "root_url": root_url,
-                "date_collected": datetime.now().isoformat(),
-                "status": "discovered",
-                "http_status": "discovered",
-                "seen_before": False,
-                "doc_type": att.get("doc_type") or classify_doc_type(sid, abs_url, title),
-                "meeting_url": detail,
-                "meeting_title": att.get("meeting_title"),
-                "meeting_date": att.get("meeting_date"),
-            })
+            discovered.append(make_discovered_item(
+                sid, name, root_url, abs_url, title, collected_at,
+                doc_type=att.get("doc_type"),
+                meeting_url=detail,
+                meeting_title=att.get("meeting_title"),
+                meeting_date=att.get("meeting_date"),
+            ))
             local_seen.add(abs_url)
 
     return {
@@ -668,6 +693,7 @@ def _collect_dia_archive(source: Dict[str, Any], session: HttpRetrySession, logg
         u = source.get("url")
         candidates = [u] if u else []
     patterns = source.get("patterns") or []
+    collected_at = datetime.now().isoformat()
 
     discovered: List[Dict[str, Any]] = []
     pages_fetched = 0
@@ -705,20 +731,7 @@ def _collect_dia_archive(source: Dict[str, Any], session: HttpRetrySession, logg
                     continue
                 if patterns and not is_match(abs_url, title, patterns):
                     continue
-                filename = Path(urlparse(abs_url).path).name or 'document.pdf'
-                discovered.append({
-                    "url": abs_url,
-                    "filename": filename,
-                    "title": title,
-                    "source": sid,
-                    "source_name": name,
-                    "root_url": root_url,
-                    "date_collected": datetime.now().isoformat(),
-                    "status": "discovered",
-                    "http_status": "discovered",
-                    "seen_before": False,
-                    "doc_type": classify_doc_type(sid, abs_url, title),
-                })
+                discovered.append(make_discovered_item(sid, name, root_url, abs_url, title, collected_at))
                 local_seen.add(abs_url)
                 continue
             # Collect detail pages on dia domain
@@ -750,20 +763,7 @@ def _collect_dia_archive(source: Dict[str, Any], session: HttpRetrySession, logg
                 continue
             if patterns and not is_match(abs_url, title, patterns):
                 continue
-            filename = Path(urlparse(abs_url).path).name or 'document.pdf'
-            discovered.append({
-                "url": abs_url,
-                "filename": filename,
-                "title": title,
-                "source": sid,
-                "source_name": name,
-                "root_url": root_url,
-                "date_collected": datetime.now().isoformat(),
-                "status": "discovered",
-                "http_status": "discovered",
-                "seen_before": False,
-                "doc_type": classify_doc_type(sid, abs_url, title),
-            })
+            discovered.append(make_discovered_item(sid, name, root_url, abs_url, title, collected_at))
             local_seen.add(abs_url)
 
     return {
@@ -773,7 +773,8 @@ def _collect_dia_archive(source: Dict[str, Any], session: HttpRetrySession, logg
     }
 
 
-def collect_source(source: Dict[str, Any], session: HttpRetrySession, logger: logging.Logger, manifest=None) -> Dict[str, Any]:
+def _collect_generic(source: Dict[str, Any], session: HttpRetrySession, logger: logging.Logger) -> Dict[str, Any]:
+    """Default collector: scan candidate pages and keep links matching configured patterns."""
     name = source.get("name") or source.get("id") or "unknown"
     sid = source.get("id") or slugify(name)
     root_url = source.get("root_url") or ""
@@ -782,84 +783,94 @@ def collect_source(source: Dict[str, Any], session: HttpRetrySession, logger: lo
         u = source.get("url")
         candidates = [u] if u else []
     patterns = source.get("patterns") or []
-
-    logger.info(f"▶️ Source start: {name} (id={sid}) candidates={len(candidates)} patterns={patterns}")
+    collected_at = datetime.now().isoformat()
 
     discovered: List[Dict[str, Any]] = []
     seen: set[str] = set()
     pages_fetched = 0
     links_total = 0
 
-    # Special-case handling for DIA sources
-    if sid == "dia_ddrb":
-        logger.info("Special handling for DDRB: following meeting detail pages and collecting docs")
-        dd = _collect_ddrb(source, session, logger)
-        discovered = dd["discovered"]
-        pages_fetched += dd["pages_fetched"]
-        links_total += dd["links_total"]
-    elif sid == "dia_board":
-        logger.info("Special handling for DIA Board: follow meeting pages and collect PDFs")
-        db = _collect_dia_board(source, session, logger)
-        discovered = db["discovered"]
-        pages_fetched += db["pages_fetched"]
-        links_total += db["links_total"]
-    elif sid in ("dia_transcripts", "dia_resolutions"):
-        logger.info(f"Special handling for {sid}: DIA archive collector")
-        da = _collect_dia_archive(source, session, logger)
-        discovered = da["discovered"]
-        pages_fetched += da["pages_fetched"]
-        links_total += da["links_total"]
-    else:
-        # Normal generic collection from candidate pages
-        for url in candidates:
-            if not url:
+    for url in candidates:
+        if not url:
+            continue
+        try:
+            resp = session.get(url)
+            pages_fetched += 1
+            logger.info(f"Fetched page: {url} status={resp.status_code} bytes={len(resp.content)}")
+        except requests.RequestException as e:
+            logger.warning(f"Page fetch failed: {url} err={e}")
+            continue
+
+        soup = BeautifulSoup(resp.content, "html.parser")
+        anchors = soup.find_all("a", href=True)
+        links_total += len(anchors)
+        logger.info(f"Discovered {len(anchors)} links on {url}")
+
+        for a in anchors:
+            href = a.get("href", "").strip()
+            title = a.get_text(strip=True) or ""
+            abs_url = absolute_link(url, href)
+            if not abs_url:
+                logger.info("Skipped link: empty href")
                 continue
-            try:
-                resp = session.get(url)
-                pages_fetched += 1
-                logger.info(f"Fetched page: {url} status={resp.status_code} bytes={len(resp.content)}")
-            except requests.RequestException as e:
-                logger.warning(f"Page fetch failed: {url} err={e}")
+            if abs_url in seen:
+                logger.info(f"Skipped duplicate: {abs_url}")
                 continue
+            keep = is_match(abs_url, title, patterns) if patterns else True
+            if keep:
+                seen.add(abs_url)
+                discovered.append(make_discovered_item(sid, name, root_url, abs_url, title, collected_at, default_filename=""))
+                logger.info(f"Kept: {abs_url} title='{title}'")
+            else:
+                logger.info(f"Skipped (no pattern match): {abs_url} title='{title}'")
 
-            soup = BeautifulSoup(resp.content, "html.parser")
-            anchors = soup.find_all("a", href=True)
-            links_total += len(anchors)
-            logger.info(f"Discovered {len(anchors)} links on {url}")
-
-            for a in anchors:
-                href = a.get("href", "").strip()
-                title = a.get_text(strip=True) or ""
-                abs_url = absolute_link(url, href)
-                if not abs_url:
-                    logger.info("Skipped link: empty href")
-                    continue
-                if abs_url in seen:
-                    logger.info(f"Skipped duplicate: {abs_url}")
-                    continue
-                keep = is_match(abs_url, title, patterns) if patterns else True
-                if keep:
-                    seen.add(abs_url)
-                    filename = Path(urlparse(abs_url).path).name
-                    item = {
-                        "url": abs_url,
-                        "filename": filename,
-                        "title": title,
-                        "source": sid,
-                        "source_name": name,
-                        "root_url": root_url,
-                        "date_collected": datetime.now().isoformat(),
-                        "status": "discovered",
-                        "http_status": "discovered",
-                        "seen_before": False,
-                        "doc_type": classify_doc_type(sid, abs_url, title),
-                    }
-                    discovered.append(item)
-                    logger.info(f"Kept: {abs_url} title='{title}'")
-                else:
-                    logger.info(f"Skipped (no pattern match): {abs_url} title='{title}'")
+    return {
+        "discovered": discovered,
+        "pages_fetched": pages_fetched,
+        "links_total": links_total,
+    }
+
+
+# Source ids with bespoke collectors; anything else falls back to _collect_generic.
+SOURCE_COLLECTORS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "dia_ddrb": _collect_ddrb,
+    "dia_board": _collect_dia_board,
+    "dia_transcripts": _collect_dia_archive,
+    "dia_resolutions": _collect_dia_archive,
+}
 
 
+def resolve_collector(sid: str) -> Callable[..., Dict[str, Any]]:
+    return SOURCE_COLLECTORS.get(sid, _collect_generic)
+
+
+def collect_source(
+    source: Dict[str, Any],
+    session: HttpRetrySession,
+    logger: logging.Logger,
+    manifest=None,
+    collector: Optional[Callable[..., Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    name = source.get("name") or source.get("id") or "unknown"
+    sid = source.get("id") or slugify(name)
+    root_url = source.get("root_url") or ""
+    candidates = source.get("candidates")
+    if not candidates:
+        u = source.get("url")
+        candidates = [u] if u else []
+    patterns = source.get("patterns") or []
+
+    logger.info(f"▶️ Source start: {name} (id={sid}) candidates={len(candidates)} patterns={patterns}")
+
+    if collector is None:
+        collector = resolve_collector(sid)
+    if collector is not _collect_generic:
+        logger.info(f"Special handling for {sid}: {collector.__name__}")
+    collected = collector(source, session, logger)
+    discovered: List[Dict[str, Any]] = collected["discovered"]
+    pages_fetched = collected["pages_fetched"]
+    links_total = collected["links_total"]
+
     # Merge with year-based store and write
     items_by_year, existing_index = load_year_store(sid)
     existing_total = sum(len(values) for values in items_by_year.values())
@@ -969,6 +980,18 @@ def collect_all(config_path: Optional[str] = None, only_source: Optional[str] =
         logger.error(f"Failed to load sources.yaml: {e}")
         return 2
 
+    # Resolve each selected source's collector up front so a bad --source fails
+    # before any network or manifest work.
+    selected: List[Tuple[Dict[str, Any], Callable[..., Dict[str, Any]]]] = []
+    for src in cfg.get("sources", []):
+        sid = src.get("id") or slugify(src.get("name", ""))
+        if only_source and only_source not in (sid, src.get("name")):
+            continue
+        selected.append((src, resolve_collector(sid)))
+    if only_source and not selected:
+        logger.error(f"No source matching '{only_source}' in {cfg_path}")
+        return 2
+
     # Initialize manifest for tracking
     manifest = get_manifest() if use_manifest else None
     if manifest:
@@ -976,16 +999,12 @@ def collect_all(config_path: Optional[str] = None, only_source: Optional[str] =
         logger.info(f"Collection run started, tracking with manifest")
 
     session = HttpRetrySession()
-    sources = cfg.get("sources", [])
     ran = 0
     total_new = 0
     total_processed = 0
 
-    for src in sources:
-        sid = src.get("id") or slugify(src.get("name", ""))
-        if only_source and only_source not in (sid, src.get("name")):
-            continue
-        result = collect_source(src, session, logger, manifest=manifest)
+    for src, collector in selected:
+        result = collect_source(src, session, logger, manifest=manifest, collector=collector)
         ran += 1
         total_new += result.get("added", 0)
         total_processed += result.get("added", 0) + result.get("existing", 0)
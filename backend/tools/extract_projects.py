@@ -20,22 +20,34 @@ CLI:
 from __future__ import annotations
 
 import argparse
+import bisect
+import hashlib
 import json
+import os
 import re
+import string
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
 from .project_schema_ext import enhance_project_schema
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
 FILES_DIR = Path("outputs/files")
 RAW_DIR = Path("outputs/raw")
 PROJECTS_DIR = Path("outputs/projects")
 PROJECTS_INDEX = PROJECTS_DIR / "projects_index.json"
 DEBUG_DIR = Path("outputs/debug")
 DDRB_DEBUG_LOG = DEBUG_DIR / "ddrb_cases.txt"
+EXTRACT_CACHE_DIR = Path("outputs/cache/extract")
 
 
 ORD_RE = re.compile(r"\b(?:ORD|ORDINANCE)[\s-]*(\d{4}-\d{2,})\b", re.I)
@@ -67,14 +79,30 @@ DDRB_PATTERN = r"""
 DDRB_CASE_RE = re.compile(DDRB_PATTERN, re.I | re.VERBOSE)
 DDRB_INLINE_RE = re.compile(DDRB_PATTERN, re.I | re.VERBOSE)
 PUD_RE = re.compile(r"\bPUD\b|PLANNED\s+UNIT\s+DEVELOPMENT", re.I)
+# ORD_RE and PUD_RE in one pass; neither can match inside the other's span.
+SNIPPET_SCAN_RE = re.compile(
+    r"(?P<ord>\b(?:ORD|ORDINANCE)[\s-]*(?P<ord_id>\d{4}-\d{2,})\b)|(?P<pud>\bPUD\b|PLANNED\s+UNIT\s+DEVELOPMENT)",
+    re.I,
+)
+
 
+# Case-insensitive body checks, so whole artifacts are never upper-cased
+DDRB_TEXT_RE = re.compile(r"DDRB", re.I)
+DDRB_WORD_RE = re.compile(r"\bDDRB\b", re.I)
+WHITESPACE_RE = re.compile(r"\s+")
+DOC_TYPE_SEPARATOR_RE = re.compile(r"[\s-]+")
+DIA_TEXT_RE = re.compile(r"DIA", re.I)
 
-LIST_PREFIX_PATTERNS = [
-    re.compile(r"^[\s]*[\-\+\*•▪◦\u2010\u2011\u2012\u2013\u2014]+\s+"),
-    re.compile(r"^[\s]*\(?\d{1,2}[A-Za-z]?\)?[\).:-]?\s+"),
-    re.compile(r"^[\s]*\(?[A-Za-z]{1,2}\)?[\).:-]?\s+"),
-    re.compile(r"^[\s]*\(?[IVXLCDM]{1,4}\)?[\).:-]?\s+", re.I),
-]
+
+# Leading list markers (bullets, numbers, letters, roman numerals), tried in order.
+LIST_PREFIX_RE = re.compile(
+    r"^(?:"
+    r"[\s]*[\-\+\*•▪◦\u2010\u2011\u2012\u2013\u2014]+\s+"
+    r"|[\s]*\(?\d{1,2}[A-Za-z]?\)?[\).:-]?\s+"
+    r"|[\s]*\(?[A-Za-z]{1,2}\)?[\).:-]?\s+"
+    r"|(?i:[\s]*\(?[IVXLCDM]{1,4}\)?[\).:-]?\s+)"
+    r")"
+)
 
 
 
@@ -126,6 +154,53 @@ ANCHOR_PROJECTS = {
     }
 }
 
+def anchor_literal(pattern: str) -> str:
+    """Longest literal word of an anchor pattern, lower-cased.
+
+    Anchor patterns are plain sequences (no alternation or optional groups),
+    so every literal word is required for a match.
+    """
+    return max(re.findall(r"(?<!\\)[A-Za-z0-9]+", pattern), key=len).lower()
+
+
+# Each anchor pattern paired with a literal that must appear on the page
+# before the regex is worth running.
+ANCHOR_PATTERNS = {
+    anchor_id: tuple(
+        (anchor_literal(pattern), re.compile(pattern, re.I))
+        for pattern in data["patterns"]
+    )
+    for anchor_id, data in ANCHOR_PROJECTS.items()
+}
+
+
+def lower_for_search(text: str) -> str:
+    """Lower-case text for substring guards placed in front of re.I patterns.
+
+    re.I also folds dotted capital I, dotless i and long s onto ASCII, which
+    str.lower() keeps (or, for U+0130, expands to "i" plus a combining dot).
+    """
+    if text.isascii():
+        return text.lower()
+    lowered = text.replace("\u0130", "i").lower()
+    return lowered.replace("\u0131", "i").replace("\u017f", "s")
+
+HTML_INDICATORS = (
+    r'<!DOCTYPE html',
+    r'<html\b',
+    r'<script\b',
+    r'<div\b',
+    r'<meta\b',
+    r'window\.',
+    r'document\.',
+    r'function\s*\(',
+    r'var\s+\w+\s*=',
+    r'SharePoint',
+    r'OneDrive',
+)
+HTML_INDICATOR_PATTERNS = tuple(re.compile(pattern, re.I) for pattern in HTML_INDICATORS)
+HTML_INDICATOR_RE = re.compile("|".join(f"(?:{pattern})" for pattern in HTML_INDICATORS), re.I)
+
 MENTION_DOC_TYPES = {
     "agenda",
     "packet",
@@ -141,7 +216,7 @@ RELATED_DOC_TYPES = MENTION_DOC_TYPES | {"exhibit", "addendum"}
 def normalize_doc_type(value: Optional[str]) -> str:
     if not value:
         return ""
-    return re.sub(r"[\s-]+", "_", value.strip().lower())
+    return DOC_TYPE_SEPARATOR_RE.sub("_", value.strip().lower())
 
 
 def guess_doc_type_from_name(name: str) -> str:
@@ -167,10 +242,9 @@ def guess_doc_type_from_name(name: str) -> str:
 
 def guess_source_from_context(path: Path, text: str) -> Tuple[str, str]:
     name_lower = path.stem.lower()
-    text_upper = text.upper()
-    if "DDRB" in text_upper or "ddrb" in name_lower:
+    if "ddrb" in name_lower or DDRB_TEXT_RE.search(text):
         return "dia_ddrb", "DDRB"
-    if "DIA" in text_upper or "resolution" in name_lower:
+    if "resolution" in name_lower or DIA_TEXT_RE.search(text):
         return "dia_board", "DIA Board"
     return "single_file", "Single File"
 
@@ -179,44 +253,77 @@ def is_remote_url(url: Optional[str]) -> bool:
     return isinstance(url, str) and url.startswith(("http://", "https://"))
 
 
+def count_html_indicators(text: str, limit: Optional[int] = None) -> int:
+    """Count HTML/JS indicator hits, stopping once the count exceeds ``limit``."""
+    total = 0
+    for pattern in HTML_INDICATOR_PATTERNS:
+        for _ in pattern.finditer(text):
+            total += 1
+            if limit is not None and total > limit:
+                return total
+    return total
+
+
+# Opening span of a text whose HTML indicators alone can mark it as HTML
+HTML_HEAD_CHARS = 2000
+
+
 def is_html_content(text: str) -> bool:
     """Check if text is primarily HTML/JavaScript content rather than document text."""
     if not text:
         return False
 
-    # Count HTML/JS patterns vs actual content
-    html_indicators = [
-        r'<!DOCTYPE html',
-        r'<html\b',
-        r'<script\b',
-        r'<div\b',
-        r'<meta\b',
-        r'window\.',
-        r'document\.',
-        r'function\s*\(',
-        r'var\s+\w+\s*=',
-        r'SharePoint',
-        r'OneDrive',
-    ]
-
-    html_matches = sum(len(re.findall(pattern, text, re.I)) for pattern in html_indicators)
+    # Count HTML/JS patterns vs actual content; most document text has none at all
+    if not HTML_INDICATOR_RE.search(text):
+        return False
 
     # If more than 10 HTML indicators in first 2000 chars, consider it HTML
-    sample = text[:2000]
-    sample_html_matches = sum(len(re.findall(pattern, sample, re.I)) for pattern in html_indicators)
+    if count_html_indicators(text[:HTML_HEAD_CHARS], limit=10) > 10:
+        return True
 
-    return sample_html_matches > 10 or html_matches > 20
+    return count_html_indicators(text, limit=20) > 20
 
 
 def is_short_text(text: str, threshold: int = 200) -> bool:
     if not text:
         return True
+    # A cleaned prefix is never longer than the cleaned whole, so a long enough
+    # prefix settles the answer without collapsing whitespace across the buffer.
+    head_len = threshold * 4
+    if len(text) > head_len and len(clean_text_fragment(text[:head_len])) >= threshold:
+        return False
     normalized = clean_text_fragment(text)
     if not normalized:
         return True
     return len(normalized) < threshold
 
 
+def load_pdf_text_cached(target: Path) -> str:
+    """Extract PDF text, reusing a sidecar keyed on path, mtime and size."""
+    st = target.stat()
+    key = hashlib.blake2b(
+        f"{target.resolve()}|{st.st_mtime_ns}|{st.st_size}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+    cache_path = EXTRACT_CACHE_DIR / f"{key}.json"
+    if cache_path.exists():
+        try:
+            return json.loads(cache_path.read_text(encoding="utf-8"))["text"]
+        except Exception:
+            pass
+
+    from .pdf_extractor import extract_text
+
+    text = extract_text(target)
+    try:
+        EXTRACT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"path": str(target), "text": text}), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except Exception as exc:
+        print(f"⚠️  Could not cache extracted text for '{target}': {exc}")
+    return text
+
+
 def process_single_project_file(file_path: Path, index: List[dict]) -> Tuple[List[dict], int, int]:
     target = file_path.expanduser()
     if not target.exists() or not target.is_file():
@@ -228,9 +335,7 @@ def process_single_project_file(file_path: Path, index: List[dict]) -> Tuple[Lis
         if suffix == ".txt":
             text = target.read_text(encoding="utf-8", errors="ignore")
         elif suffix == ".pdf":
-            from .pdf_extractor import extract_text
-
-            text = extract_text(target)
+            text = load_pdf_text_cached(target)
         else:
             print(f"⚠️  Unsupported file type for project extraction: '{target.name}'")
             return index, 0, 1
@@ -256,12 +361,24 @@ def process_single_project_file(file_path: Path, index: List[dict]) -> Tuple[Lis
         print(f"🛈 No project identifiers found in {target}")
         return index, 0, 0
 
-    dia_snippet = build_dia_snippet(text, meta.get('url'))
+    # Mentions from one file share its (empty) URL, so upsert_project keeps only
+    # the first per project id; skip the later hits before building snippets.
+    unique_hits: Dict[str, MatchHit] = {}
+    for hit in matches:
+        unique_hits.setdefault(hit.project_id.lower(), hit)
+
+    dia_snippet: Optional[str] = None
     fallback_snippet = clean_text_fragment(text[:200])
 
     created = 0
-    for hit in matches:
-        snippet = dia_snippet if hit.project_type == "DIA-RES" else hit.context
+    lookup = build_index_lookup(index)
+    for hit in unique_hits.values():
+        if hit.project_type == "DIA-RES":
+            if dia_snippet is None:
+                dia_snippet = build_dia_snippet(text, meta.get('url'))
+            snippet = dia_snippet
+        else:
+            snippet = hit.context
         if not snippet:
             snippet = fallback_snippet
         mention = make_mention(meta, hit.project_id, snippet=snippet)
@@ -277,7 +394,7 @@ def process_single_project_file(file_path: Path, index: List[dict]) -> Tuple[Lis
             "meeting_title": meta.get("meeting_title"),
             "mentions": [mention],
         }
-        index, is_new = upsert_project(index, payload)
+        index, is_new = upsert_project(index, payload, lookup)
         if is_new:
             created += 1
             print(f"➕ New project: {payload['id']} ({payload.get('title','')})")
@@ -291,7 +408,7 @@ def process_single_project_file(file_path: Path, index: List[dict]) -> Tuple[Lis
 def clean_text_fragment(text: str) -> str:
     if not text:
         return ""
-    cleaned = re.sub(r"\s+", " ", text).strip()
+    cleaned = WHITESPACE_RE.sub(" ", text).strip()
     # More aggressive punctuation cleanup for better title extraction
     cleaned = cleaned.strip("-• ,;:()[]{}'\"+=")
     return cleaned
@@ -301,15 +418,11 @@ def strip_list_prefix(value: str) -> str:
     if not value:
         return ""
     working = value
-    changed = True
-    while changed:
-        changed = False
-        for pattern in LIST_PREFIX_PATTERNS:
-            match = pattern.match(working)
-            if match:
-                working = working[match.end() :]
-                changed = True
-                break
+    while True:
+        match = LIST_PREFIX_RE.match(working)
+        if not match:
+            break
+        working = working[match.end() :]
     return working.strip()
 
 
@@ -317,14 +430,41 @@ def clean_ddrb_line(value: str) -> str:
     return strip_list_prefix(clean_text_fragment(value))
 
 
+ASCII_LETTERS = string.ascii_letters.encode("ascii")
+ASCII_UPPERCASE = string.ascii_uppercase.encode("ascii")
+
+
+def count_alpha(text: str) -> int:
+    """Number of alphabetic characters, counted in C for ASCII text."""
+    if text.isascii():
+        raw = text.encode("ascii")
+        return len(raw) - len(raw.translate(None, ASCII_LETTERS))
+    return sum(map(str.isalpha, text))
+
+
+def count_upper(text: str) -> int:
+    """Number of uppercase characters, counted in C for ASCII text."""
+    if text.isascii():
+        raw = text.encode("ascii")
+        return len(raw) - len(raw.translate(None, ASCII_UPPERCASE))
+    return sum(map(str.isupper, text))
+
+
+# Memo size for the pure title helpers (normalize_title_case, is_procedural_text,
+# clean_ddrb_candidate_text, score_ddrb_title, the admin/meeting checks); titles
+# repeat across meetings.
+TITLE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
 def normalize_title_case(text: str) -> str:
     """Convert ALL CAPS or inconsistent case to proper title case."""
     if not text:
         return ""
 
     # If mostly uppercase, convert to title case
-    upper_chars = sum(1 for c in text if c.isupper())
-    total_alpha = sum(1 for c in text if c.isalpha())
+    upper_chars = count_upper(text)
+    total_alpha = count_alpha(text)
 
     if total_alpha > 0 and upper_chars / total_alpha > 0.7:
         # Convert to title case, but preserve certain all-caps words
@@ -348,6 +488,39 @@ def normalize_title_case(text: str) -> str:
     return text
 
 
+DDRB_PROJECT_ID_RE = re.compile(r'DDRB[_\s-]*(\d{4})[_\s-]*(\d+)', re.I)
+DDRB_NAME_SUFFIX_RE = re.compile(r'\s*[–-]\s*(?:REQUEST|FINAL|CONCEPTUAL|APPROVAL|REVIEW)\s*$', re.I)
+
+# Patterns to extract project names from DDRB snippets
+DDRB_NAME_TEMPLATES = (
+    # Pattern 1: "DDRB YYYY-NNN, PROJECT NAME"
+    r'(?i)DDRB[\s_-]*{year}[\s_-]*{num}(?:,\s*|\s+)([^,;.–-]+?)(?:\s*[,;.–-]|\s*REQUEST|\s*FINAL|\s*CONCEPTUAL|\s*$)',
+
+    # Pattern 2: "project report for DDRB YYYY-NNN, PROJECT NAME"
+    r'(?i)project\s+report\s+for\s+DDRB[\s_-]*{year}[\s_-]*{num}(?:,\s*|\s+)([^,;.–-]+?)(?:\s*dated|\s*[,;.]|\s*$)',
+
+    # Pattern 3: "reviewed the project report for DDRB YYYY-NNN, PROJECT NAME"
+    r'(?i)reviewed\s+the\s+project\s+report\s+for\s+DDRB[\s_-]*{year}[\s_-]*{num}(?:,\s*|\s+)([^,;.–-]+?)(?:\s*dated|\s*[,;.]|\s*$)',
+
+    # Pattern 4: "DDRB YYYY-NNN REQUEST FOR [ACTION] – PROJECT NAME"
+    r'(?i)DDRB[\s_-]*{year}[\s_-]*{num}[\s,]*REQUEST\s+FOR\s+(?:CONCEPTUAL|FINAL|DEVIATION|SPECIAL|EXCEPTION)(?:\s+(?:APPROVAL|REVIEW))?\s*[–-]\s*([^,;.]+?)(?:\s*[,;.]|\s*$)',
+
+    # Pattern 5: Direct project name after case number and comma
+    r'(?i)DDRB[\s_-]*{year}[\s_-]*{num}[\s,]*([A-Z][^,;.–-]*?)(?:\s*REQUEST|\s*[,;.–-]|\s*$)',
+)
+
+
+@lru_cache(maxsize=4096)
+def ddrb_name_patterns(year: str, num: str) -> Tuple[Tuple[re.Pattern[str], ...], re.Pattern[str]]:
+    """Compile the name-extraction patterns for one DDRB case number."""
+    padded = num.zfill(3)
+    extraction = tuple(
+        re.compile(template.format(year=year, num=padded)) for template in DDRB_NAME_TEMPLATES
+    )
+    fallback = re.compile(rf'(?i)(?:DDRB[\s_-]*{year}[\s_-]*{num}[\s,]*)?([A-Z][A-Z\s&-]+[A-Z])')
+    return extraction, fallback
+
+
 def extract_project_name_from_snippet(snippet: str, project_id: str) -> Optional[str]:
     """Extract the actual project name from DDRB case snippet text."""
     if not snippet or not project_id:
@@ -355,42 +528,21 @@ def extract_project_name_from_snippet(snippet: str, project_id: str) -> Optional
 
     # Clean up the snippet
     snippet = snippet.replace('\n', ' ').replace('\r', '')
-    snippet = re.sub(r'\s+', ' ', snippet).strip()
+    snippet = WHITESPACE_RE.sub(' ', snippet).strip()
 
     # Extract case ID components for matching
-    case_match = re.search(r'DDRB[_\s-]*(\d{4})[_\s-]*(\d+)', project_id, re.I)
+    case_match = DDRB_PROJECT_ID_RE.search(project_id)
     if not case_match:
         return None
 
     year, num = case_match.groups()
-    case_patterns = [
-        f"DDRB {year}-{num.zfill(3)}",
-        f"DDRB-{year}-{num.zfill(3)}",
-        f"DDRB {year}-{num}",
-        f"DDRB-{year}-{num}",
-    ]
-
-    # Patterns to extract project names from DDRB snippets
-    extraction_patterns = [
-        # Pattern 1: "DDRB YYYY-NNN, PROJECT NAME"
-        r'(?i)DDRB[\s_-]*{year}[\s_-]*{num}(?:,\s*|\s+)([^,;.–-]+?)(?:\s*[,;.–-]|\s*REQUEST|\s*FINAL|\s*CONCEPTUAL|\s*$)',
-
-        # Pattern 2: "project report for DDRB YYYY-NNN, PROJECT NAME"
-        r'(?i)project\s+report\s+for\s+DDRB[\s_-]*{year}[\s_-]*{num}(?:,\s*|\s+)([^,;.–-]+?)(?:\s*dated|\s*[,;.]|\s*$)',
-
-        # Pattern 3: "reviewed the project report for DDRB YYYY-NNN, PROJECT NAME"
-        r'(?i)reviewed\s+the\s+project\s+report\s+for\s+DDRB[\s_-]*{year}[\s_-]*{num}(?:,\s*|\s+)([^,;.–-]+?)(?:\s*dated|\s*[,;.]|\s*$)',
-
-        # Pattern 4: "DDRB YYYY-NNN REQUEST FOR [ACTION] – PROJECT NAME"
-        r'(?i)DDRB[\s_-]*{year}[\s_-]*{num}[\s,]*REQUEST\s+FOR\s+(?:CONCEPTUAL|FINAL|DEVIATION|SPECIAL|EXCEPTION)(?:\s+(?:APPROVAL|REVIEW))?\s*[–-]\s*([^,;.]+?)(?:\s*[,;.]|\s*$)',
-
-        # Pattern 5: Direct project name after case number and comma
-        r'(?i)DDRB[\s_-]*{year}[\s_-]*{num}[\s,]*([A-Z][^,;.–-]*?)(?:\s*REQUEST|\s*[,;.–-]|\s*$)',
-    ]
-
-    for pattern_template in extraction_patterns:
-        pattern = pattern_template.format(year=year, num=num.zfill(3))
-        match = re.search(pattern, snippet)
+    extraction_patterns, fallback_pattern = ddrb_name_patterns(year, num)
+    # Every extraction pattern spells out the year and padded case number
+    if year not in snippet or num.zfill(3) not in snippet:
+        extraction_patterns = ()
+
+    for pattern in extraction_patterns:
+        match = pattern.search(snippet)
         if match:
             project_name = match.group(1).strip()
             project_name = clean_text_fragment(project_name)
@@ -400,15 +552,14 @@ def extract_project_name_from_snippet(snippet: str, project_id: str) -> Optional
             # Validate it's not procedural text
             if project_name and len(project_name) > 5 and not is_procedural_text(project_name):
                 # Remove common suffixes
-                project_name = re.sub(r'\s*[–-]\s*(?:REQUEST|FINAL|CONCEPTUAL|APPROVAL|REVIEW)\s*$', '', project_name, flags=re.I)
+                project_name = DDRB_NAME_SUFFIX_RE.sub('', project_name)
             project_name = project_name.strip()
 
             if project_name and len(project_name) > 3:
                 return project_name
 
     # Fallback: try to find capitalized project names near the case ID
-    fallback_pattern = rf'(?i)(?:DDRB[\s_-]*{year}[\s_-]*{num}[\s,]*)?([A-Z][A-Z\s&-]+[A-Z])'
-    for match in re.finditer(fallback_pattern, snippet):
+    for match in fallback_pattern.finditer(snippet):
         candidate = match.group(1).strip()
         candidate = clean_text_fragment(candidate)
         candidate = normalize_title_case(candidate)
@@ -422,39 +573,44 @@ def extract_project_name_from_snippet(snippet: str, project_id: str) -> Optional
     return None
 
 
+# Meeting document indicators, matched against the upper-cased title. The
+# compound indicators (MEETING-AGENDA, BOARD-MEETING, SIC-AGENDA, ...) and the
+# date-prefixed AGENDA/MINUTES/PACKET/MEETING/RESOLUTIONS shapes all contain one
+# of these literals, so only the YYYYMMDD-then-DIA/DDRB shape needs its own branch.
+MEETING_DOCUMENT_RE = re.compile(
+    r"AGENDA|MINUTES|PACKET|TRANSCRIPT|MEETING|RESOLUTIONS"
+    r"|FINANCE-BUDGET|STRATEGIC-IMPLEMENTATION"
+    r"|^\d{8}[_\s-].*?(?:DIA|DDRB)"
+)
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
 def is_meeting_document(title: str, doc_type: str = None) -> bool:
     """Check if a document is a meeting document rather than a project."""
     if not title:
         return False
 
-    title_upper = title.upper()
+    return bool(MEETING_DOCUMENT_RE.search(title.upper()))
 
-    # Direct meeting document indicators
-    meeting_indicators = [
-        'AGENDA', 'MINUTES', 'PACKET', 'TRANSCRIPT',
-        'MEETING-AGENDA', 'MEETING-PACKET', 'MEETING-MINUTES',
-        'BOARD-MEETING', 'COMMITTEE-MEETING', 'BOARD-MEETING-AGENDA',
-        'SIC-AGENDA', 'FINANCE-BUDGET', 'STRATEGIC-IMPLEMENTATION',
-        'MEETING', 'RESOLUTIONS'  # Added broader patterns
-    ]
-
-    for indicator in meeting_indicators:
-        if indicator in title_upper:
-            return True
 
-    # Date-based meeting document patterns (YYYYMMDD format at start)
-    if re.search(r'^\d{8}[_\s-].*?(DIA|DDRB)', title_upper):
-        return True
-
-    # Meeting agenda packet patterns (broader)
-    if re.search(r'\d{8}.*?(AGENDA|MINUTES|PACKET|MEETING)', title_upper):
-        return True
-
-    # Pattern like "20150527_DIA-Board-Meeting-Agenda,-Minutes-Resolutions"
-    if re.search(r'^\d{8}_.*?-?(MEETING|AGENDA|MINUTES|RESOLUTIONS)', title_upper):
-        return True
-
-    return False
+# The three prefix strips and five suffix strips used to run as separate subs,
+# each on the previous result. Optional groups in that same order (suffixes
+# reversed, since they peeled off the end) remove exactly the same text.
+DIA_TITLE_PREFIX_RE = re.compile(
+    r'^(?:RESOLUTION[-_\s]*\d{4}[-_]\d{2}[-_]\d{2}[-_])?'   # RESOLUTION-2024-09-01_
+    r'(?:RESOLUTION[-_\s]*\d{4}[-_]\d{2}[-_]\d{2}\s+)?'      # RESOLUTION 2024-09-01
+    r'(?:RESOLUTION[-_\s]*)?',                                # RESOLUTION- or RESOLUTION_
+    re.I,
+)
+DIA_TITLE_SUFFIX_RE = re.compile(
+    r'(?:[-_]SIGNED)?(?:[-_]DRAFT)?(?:[-_]FINAL)?(?:[-_]AMENDED)?(?:[-_]EXECUTED)?$',
+    re.I,
+)
+DIA_TITLE_SUFFIX_STEPS = tuple(
+    re.compile(rf'[-_]{word}$', re.I) for word in ("EXECUTED", "AMENDED", "FINAL", "DRAFT", "SIGNED")
+)
+MULTI_DASH_RE = re.compile(r'-{2,}')
+WORD_DASH_RE = re.compile(r'(\w)-(\w)')
 
 
 def clean_dia_resolution_title(title: str) -> str:
@@ -472,33 +628,23 @@ def clean_dia_resolution_title(title: str) -> str:
         return ""
 
     # Remove resolution prefixes
-    patterns_to_remove = [
-        r'^RESOLUTION[-_\s]*\d{4}[-_]\d{2}[-_]\d{2}[-_]',  # RESOLUTION-2024-09-01_
-        r'^RESOLUTION[-_\s]*\d{4}[-_]\d{2}[-_]\d{2}\s+',   # RESOLUTION 2024-09-01
-        r'^RESOLUTION[-_\s]*',                              # RESOLUTION- or RESOLUTION_
-    ]
-
-    for pattern in patterns_to_remove:
-        cleaned = re.sub(pattern, '', cleaned, flags=re.I)
+    cleaned = DIA_TITLE_PREFIX_RE.sub('', cleaned, count=1)
 
     # Remove common suffixes
-    suffixes_to_remove = [
-        r'[-_]EXECUTED$',
-        r'[-_]AMENDED$',
-        r'[-_]FINAL$',
-        r'[-_]DRAFT$',
-        r'[-_]SIGNED$',
-    ]
-
-    for suffix in suffixes_to_remove:
-        cleaned = re.sub(suffix, '', cleaned, flags=re.I)
+    if "\n" in cleaned:
+        # `$` also matches before a final newline, which a peeled suffix can
+        # expose, so multi-line titles keep the one-suffix-at-a-time strip
+        for suffix in DIA_TITLE_SUFFIX_STEPS:
+            cleaned = suffix.sub('', cleaned)
+    else:
+        cleaned = DIA_TITLE_SUFFIX_RE.sub('', cleaned, count=1)
 
     # Convert underscores and dashes to spaces, but preserve important dashes
     cleaned = cleaned.replace('_', ' ')
 
     # Replace multiple dashes with single spaces, but keep single dashes in addresses/names
-    cleaned = re.sub(r'-{2,}', ' ', cleaned)  # Multiple dashes become spaces
-    cleaned = re.sub(r'(\w)-(\w)', r'\1 \2', cleaned)  # Single dashes between words become spaces
+    cleaned = MULTI_DASH_RE.sub(' ', cleaned)  # Multiple dashes become spaces
+    cleaned = WORD_DASH_RE.sub(r'\1 \2', cleaned)  # Single dashes between words become spaces
 
     # Clean up extra whitespace and punctuation
     cleaned = clean_text_fragment(cleaned)
@@ -513,15 +659,9 @@ def clean_dia_resolution_title(title: str) -> str:
     return cleaned
 
 
-def is_procedural_text(text: str) -> bool:
-    """Check if text appears to be procedural/administrative rather than a project name."""
-    if not text:
-        return True
-
-    text_upper = text.upper()
-
-    # Common procedural indicators
-    procedural_patterns = [
+PROCEDURAL_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
         r'\bBOARD\s+MEMBER\b',
         r'\bMODIFIED\s+THEIR\b',
         r'\bGRANTING\s+FINAL\b',
@@ -533,10 +673,21 @@ def is_procedural_text(text: str) -> bool:
         r'\bREPORT\s+ON\b',
         r'\bWITH\s+THE\s+FOLLOWING\s+RECOMMENDATIONS\b',
         r'^(THE|A|AN)\s+\w+\s+(DISCUSSION|REPORT|REVIEW)$',
-    ]
+    )
+)
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def is_procedural_text(text: str) -> bool:
+    """Check if text appears to be procedural/administrative rather than a project name."""
+    if not text:
+        return True
+
+    text_upper = text.upper()
 
-    for pattern in procedural_patterns:
-        if re.search(pattern, text_upper):
+    # Common procedural indicators
+    for pattern in PROCEDURAL_PATTERNS:
+        if pattern.search(text_upper):
             return True
 
     # Check for sentence fragments (incomplete thoughts)
@@ -560,17 +711,23 @@ def strip_ddrb_identifier(value: str) -> str:
     return cleaned
 
 
+# Trailing boilerplate cut from DDRB title candidates. The leading "The motion"
+# strip sits between the two groups, so they stay separate to keep that order.
+DDRB_TAIL_CUT_RE = re.compile(
+    r"[-–—,:\s]*(?:Applicant(?:[:\s].*)?|Board\s+Member.*|With\s+The\s+Following\s+Recommendations.*|Motion\s+Was\s+Made.*)$",
+    re.I,
+)
+DDRB_HEAD_MOTION_RE = re.compile(r"^The\s+motion[^,]*,\s*", re.I)
+DDRB_LATE_TAIL_CUT_RE = re.compile(r"[-–—,:\s]*(?:Public\s+Comments.*|Staff\s+Report.*)$", re.I)
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
 def clean_ddrb_candidate_text(value: str) -> str:
     if not value:
         return ""
-    cleaned = value
-    cleaned = re.sub(r"[-–—,:\s]*Applicant(?:[:\s].*)?$", "", cleaned, flags=re.I)
-    cleaned = re.sub(r"[-–—,:\s]*Board\s+Member.*$", "", cleaned, flags=re.I)
-    cleaned = re.sub(r"[-–—,:\s]*With\s+The\s+Following\s+Recommendations.*$", "", cleaned, flags=re.I)
-    cleaned = re.sub(r"[-–—,:\s]*Motion\s+Was\s+Made.*$", "", cleaned, flags=re.I)
-    cleaned = re.sub(r"^The\s+motion[^,]*,\s*", "", cleaned, flags=re.I)
-    cleaned = re.sub(r"[-–—,:\s]*Public\s+Comments.*$", "", cleaned, flags=re.I)
-    cleaned = re.sub(r"[-–—,:\s]*Staff\s+Report.*$", "", cleaned, flags=re.I)
+    cleaned = DDRB_TAIL_CUT_RE.sub("", value, count=1)
+    cleaned = DDRB_HEAD_MOTION_RE.sub("", cleaned, count=1)
+    cleaned = DDRB_LATE_TAIL_CUT_RE.sub("", cleaned, count=1)
     cleaned = cleaned.rstrip("-–—,: •")
     return cleaned.strip()
 
@@ -580,15 +737,46 @@ def is_descriptive_candidate(value: str) -> bool:
         return False
     if DDRB_INLINE_RE.search(value):
         return False
-    alpha_chars = sum(1 for ch in value if ch.isalpha())
+    alpha_chars = count_alpha(value)
     if alpha_chars < 4:
         return False
-    words = [token for token in value.split() if any(c.isalpha() for c in token)]
-    if len(words) < 2 and alpha_chars < 10:
-        return False
-    return True
+    if alpha_chars >= 10:
+        return True
+    # Short values need at least two tokens that contain a letter
+    words = 0
+    for token in value.split():
+        if any(map(str.isalpha, token)):
+            words += 1
+            if words >= 2:
+                return True
+    return False
 
 
+DDRB_ADMIN_PATTERNS = tuple(
+    re.compile(pattern, re.I)
+    for pattern in (
+        r"\b(discussion|minutes|review|report|agenda|meeting)\b",
+        r"\b(board\s+member|granting|approval\s+of)\b",
+        r"\b(request\s+for\s+final|modified\s+their)\b",
+    )
+)
+DDRB_PROJECT_PATTERNS = tuple(
+    re.compile(pattern, re.I)
+    for pattern in (
+        r"\b(hotel|residential|mixed\s+use|development|building|renovation)\b",
+        r"\b(conversion|expansion|construction|parking|garage)\b",
+        r"\b(restaurant|retail|office|townhomes|apartments)\b",
+        r"\b(\d+\s+\w+\s+street|street|avenue|road|boulevard)\b",  # addresses
+    )
+)
+
+
+# Highest score_ddrb_title can return: descriptive (10) + ideal length (5) +
+# four project-term bonuses (12) + alpha ratio (2) + word count (6).
+DDRB_TITLE_SCORE_MAX = 35
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
 def score_ddrb_title(value: Optional[str]) -> int:
     if not value:
         return 0
@@ -622,28 +810,17 @@ def score_ddrb_title(value: Optional[str]) -> int:
         score -= 3
 
     # Enhanced penalties for administrative language
-    admin_patterns = [
-        r"\b(discussion|minutes|review|report|agenda|meeting)\b",
-        r"\b(board\s+member|granting|approval\s+of)\b",
-        r"\b(request\s+for\s+final|modified\s+their)\b"
-    ]
-    for pattern in admin_patterns:
-        if re.search(pattern, text, re.I):
+    for pattern in DDRB_ADMIN_PATTERNS:
+        if pattern.search(text):
             score -= 5
 
     # Bonus for project-like terms
-    project_patterns = [
-        r"\b(hotel|residential|mixed\s+use|development|building|renovation)\b",
-        r"\b(conversion|expansion|construction|parking|garage)\b",
-        r"\b(restaurant|retail|office|townhomes|apartments)\b",
-        r"\b(\d+\s+\w+\s+street|street|avenue|road|boulevard)\b"  # addresses
-    ]
-    for pattern in project_patterns:
-        if re.search(pattern, text, re.I):
+    for pattern in DDRB_PROJECT_PATTERNS:
+        if pattern.search(text):
             score += 3
 
     # Character composition scoring
-    alpha_chars = sum(1 for ch in text if ch.isalpha())
+    alpha_chars = count_alpha(text)
     if length:
         alpha_ratio = alpha_chars / length
         if alpha_ratio > 0.65:
@@ -686,8 +863,13 @@ def select_ddrb_title(context_lines: List[str], id_index: Optional[int]) -> Tupl
 
     origin_weights = {"id_line": 6, "after": 3, "before": 3, "other": 1}
     seen_text: set[str] = set()
-    normalized_candidates: List[Tuple[str, str]] = []
+    best: Optional[Tuple[str, int, str]] = None
+    # Sources are ordered by non-increasing origin weight, so once the leader
+    # beats anything the next origin could reach, nothing later can overtake it
+    # (ties already go to the earlier candidate).
     for source, origin in candidate_sources:
+        if best is not None and best[1] >= DDRB_TITLE_SCORE_MAX + origin_weights.get(origin, 0):
+            break
         candidate = strip_ddrb_identifier(source)
         if not candidate:
             candidate = strip_list_prefix(source).strip(":-–—• ")
@@ -699,30 +881,23 @@ def select_ddrb_title(context_lines: List[str], id_index: Optional[int]) -> Tupl
         if key in seen_text:
             continue
         seen_text.add(key)
-        normalized_candidates.append((candidate, origin))
-
-    # Score all candidates and pick the best one
-    scored_candidates = []
-    for candidate, origin in normalized_candidates:
-        if not candidate:
-            continue
 
         # Apply case normalization
         normalized = normalize_title_case(candidate)
         normalized = clean_ddrb_candidate_text(normalized)
-        
+
         # Score the candidate
         title_score = score_ddrb_title(normalized)
         origin_bonus = origin_weights.get(origin, 0)
         total_score = title_score + origin_bonus
 
-        if total_score > 0:  # Only consider positive-scoring candidates
-            scored_candidates.append((normalized, total_score, origin))
+        # Only consider positive-scoring candidates; keep the first best one
+        if total_score > 0 and (best is None or total_score > best[1]):
+            best = (normalized, total_score, origin)
 
     # Return the highest-scoring candidate
-    if scored_candidates:
-        scored_candidates.sort(key=lambda x: x[1], reverse=True)
-        best_candidate, best_score, best_origin = scored_candidates[0]
+    if best is not None:
+        best_candidate, best_score, best_origin = best
         return best_candidate, origin_weights.get(best_origin, 0)
 
     return None, 0
@@ -747,17 +922,29 @@ def extract_context_line(text: str, match: re.Match[str], window: int = 160) ->
     return clean_text_fragment(text[fallback_start:fallback_end])
 
 
+def build_line_index(text: str) -> Tuple[List[str], List[int]]:
+    """Split ``text`` into lines once and record the offset of every newline."""
+    lines = text.splitlines()
+    newline_offsets: List[int] = []
+    pos = text.find("\n")
+    while pos != -1:
+        newline_offsets.append(pos)
+        pos = text.find("\n", pos + 1)
+    return lines, newline_offsets
+
+
 def extract_ddrb_context(
     text: str,
     match: re.Match[str],
     *,
     lines_before: int = 3,
     lines_after: int = 2,
+    line_table: Optional[Tuple[List[str], List[int]]] = None,
 ) -> Tuple[str, Optional[str], int]:
     if not text:
         return "", None, 0
-    lines = text.splitlines()
-    line_index = text.count("\n", 0, match.start())
+    lines, newline_offsets = line_table or build_line_index(text)
+    line_index = bisect.bisect_left(newline_offsets, match.start())
     start_idx = max(0, line_index - lines_before)
     end_idx = min(len(lines), line_index + lines_after + 1)
     raw_window = lines[start_idx:end_idx]
@@ -810,8 +997,14 @@ def make_mention(data: dict, pid: str, snippet: str = "", doc_type_override: Opt
 
 def build_dia_snippet(text: str, url: str = None) -> str:
     """Enhanced DIA snippet builder that extracts financial and development context."""
-    ords = ", ".join(sorted({mm.group(1) for mm in ORD_RE.finditer(text)}))
-    has_pud = bool(PUD_RE.search(text))
+    ord_ids: set[str] = set()
+    has_pud = False
+    for mm in SNIPPET_SCAN_RE.finditer(text):
+        if mm.group("ord"):
+            ord_ids.add(mm.group("ord_id"))
+        else:
+            has_pud = True
+    ords = ", ".join(sorted(ord_ids))
     parts: List[str] = []
     if ords:
         parts.append(f"Ordinances: {ords}")
@@ -839,56 +1032,119 @@ def build_dia_snippet(text: str, url: str = None) -> str:
     return clean_text_fragment(text[:200])
 
 
+DEVELOPMENT_INDICATORS = {
+    "gateway": "Gateway Jax mixed-use development project",
+    "pearl": "Pearl Street development district",
+    "lavilla": "LaVilla historic district redevelopment",
+    "shipyards": "Shipyards riverfront development",
+    "ford": "Ford on Bay development project",
+    "lot-j": "Lot J mixed-use stadium district",
+    "brooklyn": "Brooklyn district development",
+}
+SCALE_INDICATORS = {
+    "modification": "project modification",
+    "allocation": "funding allocation",
+    "disposition": "property disposition",
+    "incentive": "development incentives",
+}
+# Zero-width lookahead so overlapping keywords are all reported; no keyword is
+# a prefix of another, so each start position yields the only possible match.
+URL_KEYWORD_RE = re.compile(
+    "(?=({}))".format(
+        "|".join(
+            re.escape(keyword)
+            for keyword in ("term-sheet", "termsheet", *DEVELOPMENT_INDICATORS, *SCALE_INDICATORS)
+        )
+    )
+)
+URL_RESOLUTION_RE = re.compile(r'R-(\d{4}-\d{2}-\d{2})')
+
+
 def extract_metadata_snippet(url: str) -> str:
     """Extract meaningful information from URLs and document names when text is limited."""
     if not url:
         return ""
 
     snippet_parts = []
-    url_lower = url.lower()
+    # Every keyword present in the URL, found in one scan
+    found = {mm.group(1) for mm in URL_KEYWORD_RE.finditer(url.lower())}
 
     # Look for financial indicators in URL
-    if "term-sheet" in url_lower or "termsheet" in url_lower:
+    if "term-sheet" in found or "termsheet" in found:
         snippet_parts.append("Contains term sheet with financial arrangements")
 
     # Look for major development project indicators
-    development_indicators = {
-        "gateway": "Gateway Jax mixed-use development project",
-        "pearl": "Pearl Street development district",
-        "lavilla": "LaVilla historic district redevelopment",
-        "shipyards": "Shipyards riverfront development",
-        "ford": "Ford on Bay development project",
-        "lot-j": "Lot J mixed-use stadium district",
-        "brooklyn": "Brooklyn district development"
-    }
-
-    for key, description in development_indicators.items():
-        if key in url_lower:
+    for key, description in DEVELOPMENT_INDICATORS.items():
+        if key in found:
             snippet_parts.append(description)
             break
 
     # Look for project scale indicators from URL components
-    scale_indicators = []
-    if "modification" in url_lower:
-        scale_indicators.append("project modification")
-    if "allocation" in url_lower:
-        scale_indicators.append("funding allocation")
-    if "disposition" in url_lower:
-        scale_indicators.append("property disposition")
-    if "incentive" in url_lower:
-        scale_indicators.append("development incentives")
+    scale_indicators = [label for key, label in SCALE_INDICATORS.items() if key in found]
 
     if scale_indicators:
         snippet_parts.append(f"Project involves: {', '.join(scale_indicators)}")
 
     # Extract resolution numbers for tracking
-    res_match = re.search(r'R-(\d{4}-\d{2}-\d{2})', url)
+    res_match = URL_RESOLUTION_RE.search(url)
     if res_match:
         snippet_parts.append(f"Resolution {res_match.group(1)}")
 
     return "; ".join(snippet_parts) if snippet_parts else ""
 
 
+# Development scale and public/incentive term groups. Each group used to be its
+# own findall pass; ENHANCED_TERMS_RE scans for all of them at once and the
+# capture group index says which list a hit belongs to.
+SCALE_TERM_GROUPS = (
+    r'mixed[\s-]?use|mixed[\s-]?development',
+    r'redevelopment|development',
+    r'riverfront|waterfront',
+    r'plaza|tower|district|complex',
+    r'residential\s+units?|commercial\s+space',
+    r'parking\s+garage|parking\s+spaces?',
+)
+PUBLIC_TERM_GROUPS = (
+    r'incentive\s+package|incentive\s+agreement|public\s+incentive',
+    r'tax\s+increment|TIF|CRA',
+    r'public[\s-]?private\s+partnership|PPP',
+    r'term\s+sheet|funding\s+agreement',
+)
+ENHANCED_TERMS_RE = re.compile(
+    r'\b(?:' + '|'.join(f'({group})' for group in SCALE_TERM_GROUPS + PUBLIC_TERM_GROUPS) + r')\b',
+    re.IGNORECASE,
+)
+# Same alternation for already lower-cased ASCII text, where re.I is redundant.
+ENHANCED_TERMS_LOWER_RE = re.compile(ENHANCED_TERMS_RE.pattern.lower())
+# "mixed development" is the only term that contains another group's term; the
+# separate passes also counted its trailing "development" when a boundary precedes it.
+MIXED_DEVELOPMENT_TAIL_RE = re.compile(r'\bdevelopment$', re.IGNORECASE)
+
+
+def collect_enhanced_terms(text: str) -> Tuple[List[str], List[str]]:
+    """Lowercased scale and public terms, grouped in pattern order then text order."""
+    groups: List[List[Tuple[int, str]]] = [[] for _ in range(len(SCALE_TERM_GROUPS) + len(PUBLIC_TERM_GROUPS))]
+    if text.isascii():
+        # Case-fold once up front; only non-ASCII text needs re.I's Unicode folding.
+        matches = ENHANCED_TERMS_LOWER_RE.finditer(text.lower())
+    else:
+        matches = ENHANCED_TERMS_RE.finditer(text)
+    for match in matches:
+        idx = match.lastindex - 1
+        term = match.group(0)
+        groups[idx].append((match.start(), term.lower()))
+        if idx == 0:
+            tail = MIXED_DEVELOPMENT_TAIL_RE.search(term)
+            if tail:
+                groups[1].append((match.start() + tail.start(), tail.group(0).lower()))
+    scale_groups = groups[: len(SCALE_TERM_GROUPS)]
+    public_groups = groups[len(SCALE_TERM_GROUPS) :]
+    groups[1].sort()
+    scale_terms = [term for group in scale_groups for _, term in group]
+    public_terms = [term for group in public_groups for _, term in group]
+    return scale_terms, public_terms
+
+
 def extract_enhanced_snippet(text: str, url: str = None) -> str:
     """Extract financial amounts, development terms, and project context from text."""
     if not text:
@@ -901,38 +1157,15 @@ def extract_enhanced_snippet(text: str, url: str = None) -> str:
     if financials:
         snippet_parts.append(f"Financial: {', '.join(financials[:3])}")  # Top 3 amounts
 
-    # Extract development scale indicators
-    scale_terms = []
-    scale_patterns = [
-        r'\b(?:mixed[\s-]?use|mixed[\s-]?development)\b',
-        r'\b(?:redevelopment|development)\b',
-        r'\b(?:riverfront|waterfront)\b',
-        r'\b(?:plaza|tower|district|complex)\b',
-        r'\b(?:residential\s+units?|commercial\s+space)\b',
-        r'\b(?:parking\s+garage|parking\s+spaces?)\b',
-    ]
-
-    for pattern in scale_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        scale_terms.extend([m.lower() for m in matches])
+    # Extract development scale and public/incentive terms in one pass
+    scale_terms, public_terms = collect_enhanced_terms(text)
 
+    # Development scale indicators
     if scale_terms:
         unique_terms = list(dict.fromkeys(scale_terms))[:3]  # Keep order, limit to 3
         snippet_parts.append(f"Development: {', '.join(unique_terms)}")
 
-    # Extract public/incentive mentions
-    public_terms = []
-    public_patterns = [
-        r'\b(?:incentive\s+package|incentive\s+agreement|public\s+incentive)\b',
-        r'\b(?:tax\s+increment|TIF|CRA)\b',
-        r'\b(?:public[\s-]?private\s+partnership|PPP)\b',
-        r'\b(?:term\s+sheet|funding\s+agreement)\b',
-    ]
-
-    for pattern in public_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        public_terms.extend([m.lower() for m in matches])
-
+    # Public/incentive mentions
     if public_terms:
         unique_terms = list(dict.fromkeys(public_terms))[:2]
         snippet_parts.append(f"Public: {', '.join(unique_terms)}")
@@ -940,6 +1173,29 @@ def extract_enhanced_snippet(text: str, url: str = None) -> str:
     return "; ".join(snippet_parts) if snippet_parts else ""
 
 
+# Directories searched for extracted PDF text, in lookup priority order
+PDF_TEXT_DIRS = tuple(
+    Path("outputs/files") / source / year
+    for source in ("dia_board", "dia_resolutions")
+    for year in ("2025", "2024", "2023")
+)
+
+
+@lru_cache(maxsize=None)
+def pdf_text_index() -> Dict[str, Tuple[Path, ...]]:
+    """Text files in PDF_TEXT_DIRS by name, listed once per process."""
+    found: Dict[str, List[Path]] = {}
+    for directory in PDF_TEXT_DIRS:
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            continue
+        for name in names:
+            if name.endswith(".txt"):
+                found.setdefault(name, []).append(directory / name)
+    return {name: tuple(paths) for name, paths in found.items()}
+
+
 def try_load_pdf_snippet(url: str) -> str:
     """Try to load actual PDF text content for better snippet extraction."""
     if not url:
@@ -948,8 +1204,6 @@ def try_load_pdf_snippet(url: str) -> str:
     # Try to find corresponding text file in outputs/files/
     try:
         from urllib.parse import urlparse
-        from pathlib import Path
-        import hashlib
 
         # Generate the same filename the PDF extractor would use
         parsed_url = urlparse(url)
@@ -957,25 +1211,13 @@ def try_load_pdf_snippet(url: str) -> str:
         if not filename.endswith('.pdf'):
             return ""
 
-        # Look for text file in various locations
-        possible_paths = [
-            f"outputs/files/dia_board/2025/{filename}.txt",
-            f"outputs/files/dia_board/2024/{filename}.txt",
-            f"outputs/files/dia_board/2023/{filename}.txt",
-            f"outputs/files/dia_resolutions/2025/{filename}.txt",
-            f"outputs/files/dia_resolutions/2024/{filename}.txt",
-            f"outputs/files/dia_resolutions/2023/{filename}.txt",
-        ]
-
-        for path_str in possible_paths:
-            path = Path(path_str)
-            if path.exists():
-                try:
-                    content = path.read_text(encoding='utf-8')
-                    # Extract meaningful snippet from PDF content
-                    return extract_enhanced_snippet(content[:2000])  # First 2000 chars
-                except Exception:
-                    continue
+        for path in pdf_text_index().get(f"{filename}.txt", ()):
+            try:
+                content = path.read_text(encoding='utf-8')
+                # Extract meaningful snippet from PDF content
+                return extract_enhanced_snippet(content[:2000])  # First 2000 chars
+            except Exception:
+                continue
 
     except Exception:
         pass
@@ -983,39 +1225,70 @@ def try_load_pdf_snippet(url: str) -> str:
     return ""
 
 
+# Match $1.5M, $500,000, $10 million, etc.
+MONEY_RE = re.compile(r"\$\s?\d{1,3}(?:,\d{3})*(?:\.\d+)?\s?(?:million|billion|M|B|k|K)?")
+
+
 def extract_financials(text: str) -> List[str]:
     """Extract currency amounts from text."""
     if not text:
         return []
-    # Match $1.5M, $500,000, $10 million, etc.
-    money_pattern = r"\$\s?\d{1,3}(?:,\d{3})*(?:\.\d+)?\s?(?:million|billion|M|B|k|K)?"
-    matches = re.findall(money_pattern, text)
+    matches = MONEY_RE.findall(text)
     return list(set(matches))
 
 
+def cached_financials(context: str, cache: Dict[str, List[str]]) -> List[str]:
+    """extract_financials through a per-document memo; hits on one line share a context."""
+    found = cache.get(context)
+    if found is None:
+        found = cache[context] = extract_financials(context)
+    return list(found)
+
+
+PAGE_MARKER = "[[PAGE "
+
+
+def iter_pages(text: str) -> Iterable[Tuple[int, str]]:
+    """Yield (page_number, content) pairs from "[[PAGE N]]" delimited text.
+
+    Walks the delimiters by offset and slices each page body only when the
+    caller reaches it, so one page is held at a time.
+    """
+    start = 0
+    text_len = len(text)
+    while start <= text_len:
+        end = text.find(PAGE_MARKER, start)
+        if end == -1:
+            end = text_len
+        # Chunk format: "N]]\nContent..."
+        close = text.find("]]", start, end)
+        page_num = None
+        if close != -1:
+            try:
+                page_num = int(text[start:close])
+            except ValueError:
+                pass
+        if page_num is not None:
+            yield page_num, text[close + 2:end]
+        else:
+            # Fallback if malformed; skip empty chunks such as the one before
+            # a leading delimiter
+            chunk = text[start:end]
+            if chunk.strip():
+                yield 1, chunk
+        start = end + len(PAGE_MARKER)
+
+
 def extract_matches_from_text(text: str, doc_type: Optional[str], source: Optional[str]) -> List[MatchHit]:
     if not text:
         return []
     
     hits: Dict[str, MatchHit] = {}
+    financials_cache: Dict[str, List[str]] = {}
     
     # Check if text is paginated
-    pages = []
-    if "[[PAGE " in text[:100]:
-        # Split by page delimiter
-        raw_pages = text.split("[[PAGE ")
-        # Skip the first empty chunk if file starts with delimiter
-        for chunk in raw_pages:
-            if not chunk.strip():
-                continue
-            # Chunk format: "N]]\nContent..."
-            try:
-                page_num_str, content = chunk.split("]]", 1)
-                page_num = int(page_num_str)
-                pages.append((page_num, content))
-            except ValueError:
-                # Fallback if malformed
-                pages.append((1, chunk))
+    if PAGE_MARKER in text[:100]:
+        pages: Iterable[Tuple[int, str]] = iter_pages(text)
     else:
         pages = [(1, text)]
 
@@ -1023,25 +1296,33 @@ def extract_matches_from_text(text: str, doc_type: Optional[str], source: Option
     allow_ddrb = doc_type_norm in MENTION_DOC_TYPES or (source or "").lower() in DDRB_SOURCE_IDS
 
     for page_num, page_text in pages:
+        page_lower = lower_for_search(page_text)
+
         # 1. Standard DIA Resolutions
         for match in DIA_RESOLUTION_RE.finditer(page_text):
             pid = normalize_dia_resolution(match)
             if pid in hits:
                 continue
+            context = extract_context_line(page_text, match)
             hits[pid] = MatchHit(
                 project_id=pid,
                 project_type="DIA-RES",
-                context=extract_context_line(page_text, match),
+                context=context,
                 position=match.start(),
                 page_number=page_num,
-                financials=extract_financials(extract_context_line(page_text, match))
+                financials=cached_financials(context, financials_cache)
             )
 
         # 2. DDRB Cases
-        if allow_ddrb:
+        if allow_ddrb and "ddrb" in page_lower:
+            page_lines = None
             for match in DDRB_CASE_RE.finditer(page_text):
                 pid = normalize_ddrb_case(match)
-                context, candidate_title, origin_bonus = extract_ddrb_context(page_text, match)
+                if page_lines is None:
+                    page_lines = build_line_index(page_text)
+                context, candidate_title, origin_bonus = extract_ddrb_context(
+                    page_text, match, line_table=page_lines
+                )
                 title_score = score_ddrb_title(candidate_title) + origin_bonus
                 hits[pid] = MatchHit(
                     project_id=pid,
@@ -1051,13 +1332,15 @@ def extract_matches_from_text(text: str, doc_type: Optional[str], source: Option
                     title_score=title_score,
                     position=match.start(),
                     page_number=page_num,
-                    financials=extract_financials(context)
+                    financials=cached_financials(context, financials_cache)
                 )
 
         # 3. Anchor Matches
         for anchor_id, data in ANCHOR_PROJECTS.items():
-            for pattern in data["patterns"]:
-                match = re.search(pattern, page_text, re.I)
+            for literal, pattern in ANCHOR_PATTERNS[anchor_id]:
+                if literal not in page_lower:
+                    continue
+                match = pattern.search(page_text)
                 if match:
                     # Use anchor ID as key if not already found (or override?)
                     # For now, we add it as a separate hit. Clusterer will merge.
@@ -1076,7 +1359,7 @@ def extract_matches_from_text(text: str, doc_type: Optional[str], source: Option
                         position=match.start(),
                         page_number=page_num,
                         anchor_id=anchor_id,
-                        financials=extract_financials(context)
+                        financials=cached_financials(context, financials_cache)
                     )
                     break # One hit per anchor per page is sufficient
 
@@ -1089,6 +1372,8 @@ class TextArtifact:
     year: str
     txt_path: Path
     meta_path: Path
+    # Parsed meta, kept from the directory walk so it is not read twice
+    meta: Optional[dict] = None
 
 
 @dataclass
@@ -1104,51 +1389,177 @@ class MatchHit:
     financials: Optional[List[str]] = None
 
 
-def iter_text_artifacts(source: Optional[str], year: Optional[str]) -> Iterable[TextArtifact]:
-    if not FILES_DIR.exists():
-        return []
+def iter_text_artifacts(
+    source: Optional[str],
+    year: Optional[str],
+    meta_items: Optional[Iterable[Tuple[str, str, Path, Optional[dict]]]] = None,
+) -> Iterable[TextArtifact]:
+    """Yield artifacts whose meta points at an existing text file.
+
+    ``meta_items`` reuses a walk already parsed by iter_parsed_meta_items.
+    """
+    if meta_items is None:
+        meta_items = iter_parsed_meta_items(source, year)
     seen_meta: set[Path] = set()
-    for src_dir in sorted([p for p in FILES_DIR.iterdir() if p.is_dir()]):
-        sid = src_dir.name
-        if source and sid != source:
+    for sid, yy, meta_path, meta_data in meta_items:
+        if meta_path in seen_meta or meta_data is None:
             continue
-        for ydir in sorted([p for p in src_dir.iterdir() if p.is_dir()]):
-            yy = ydir.name
-            if year and yy != year:
-                continue
-            meta_candidates: List[Path] = []
-            mdir = ydir / "meta"
-            if mdir.exists():
-                meta_candidates.extend(sorted(mdir.glob("*.json")))
-            meta_candidates.extend(sorted(ydir.glob("*.meta.json")))
-            for meta_path in meta_candidates:
-                if meta_path in seen_meta:
-                    continue
-                stem = meta_path.stem.lower()
-                if "sample" in stem:
-                    continue
-                try:
-                    meta_data = json.loads(meta_path.read_text(encoding="utf-8"))
-                except Exception:
-                    continue
-                text_field = meta_data.get("local_text_path") or meta_data.get("text_path")
-                if not text_field:
-                    continue
-                txt_path = Path(text_field)
-                if not txt_path.is_absolute() and not txt_path.exists():
-                    candidate = Path.cwd() / txt_path
-                    if candidate.exists():
-                        txt_path = candidate
-                if not txt_path.exists():
-                    continue
-                seen_meta.add(meta_path)
-                yield TextArtifact(source=sid, year=yy, txt_path=txt_path, meta_path=meta_path)
+        text_field = meta_data.get("local_text_path") or meta_data.get("text_path")
+        if not text_field:
+            continue
+        txt_path = Path(text_field)
+        if not txt_path.is_absolute() and not txt_path.exists():
+            candidate = Path.cwd() / txt_path
+            if candidate.exists():
+                txt_path = candidate
+        if not txt_path.exists():
+            continue
+        seen_meta.add(meta_path)
+        yield TextArtifact(source=sid, year=yy, txt_path=txt_path, meta_path=meta_path, meta=meta_data)
+
+
+@dataclass
+class ArtifactScan:
+    """Per-artifact results computed off the main process."""
+
+    artifact: TextArtifact
+    meta: Optional[dict] = None
+    source_value: str = ""
+    is_dia_ddrb: bool = False
+    matches: List[MatchHit] = field(default_factory=list)
+    debug_entries: List[str] = field(default_factory=list)
+    skipped: bool = False
+    dia_snippet: str = ""
+    fallback_snippet: str = ""
+
+
+def scan_text_artifact(art: TextArtifact) -> ArtifactScan:
+    """Read one artifact and run the text-only extraction steps on it."""
+    scan = ArtifactScan(artifact=art)
+    try:
+        meta = art.meta if art.meta is not None else read_json(art.meta_path)
+        source_value = (meta.get("source") or art.source or "").strip()
+        # Same decoding as read_text(), read in two steps: an HTML-heavy opening
+        # already settles is_html_content(), so such DDRB pages stop there.
+        with art.txt_path.open(encoding="utf-8", errors="ignore") as fh:
+            text = fh.read(HTML_HEAD_CHARS)
+            html_head = (
+                source_value.lower() == "dia_ddrb"
+                and count_html_indicators(text, limit=10) > 10
+            )
+            if not html_head:
+                text += fh.read()
+    except Exception as e:
+        if art.source == "dia_ddrb":
+            scan.debug_entries.append(f"[ERROR] Failed to read {art.txt_path}: {e}")
+        scan.skipped = True
+        return scan
+    scan.meta = meta
+
+    # Skip HTML-heavy content for DDRB processing
+    source_lower = source_value.lower()
+    scan.source_value = source_value
+    scan.is_dia_ddrb = source_lower == "dia_ddrb"
+    if scan.is_dia_ddrb:
+        if html_head or is_html_content(text):
+            debug_lines = [
+                "[SKIPPED HTML]",
+                f"File: {art.txt_path.name}",
+                f"Reason: HTML/JavaScript content detected",
+            ]
+            title_val = meta.get("title")
+            if title_val:
+                debug_lines.append(f"Title: {clean_text_fragment(str(title_val))}")
+            url_val = meta.get("url")
+            if url_val:
+                debug_lines.append(f"URL: {url_val}")
+            scan.debug_entries.append("\n".join(debug_lines))
+            scan.skipped = True
+            return scan
+        if is_short_text(text):
+            debug_lines = [
+                "[SHORT TEXT]",
+                f"File: {art.txt_path.name}",
+                f"Length: {len(clean_text_fragment(text))} characters",
+            ]
+            title_val = meta.get("title")
+            if title_val:
+                debug_lines.append(f"Title: {clean_text_fragment(str(title_val))}")
+            url_val = meta.get("url")
+            if url_val:
+                debug_lines.append(f"URL: {url_val}")
+            scan.debug_entries.append("\n".join(debug_lines))
+
+    doc_type_value = meta.get("doc_type")
+    matches = extract_matches_from_text(text, doc_type_value, meta.get("source") or art.source)
+    # Cleaned opening of the text, shared by the debug and snippet fallbacks
+    head_snippet = clean_text_fragment(text[:200])
+
+    doc_type_norm = normalize_doc_type(doc_type_value)
+    allow_ddrb = doc_type_norm in MENTION_DOC_TYPES or source_lower in DDRB_SOURCE_IDS
+    has_ddrb_hit = any(hit.project_type == "DDRB" for hit in matches)
+
+    # Cheap checks first: the whole-text word search only runs for DDRB-eligible
+    # artifacts that produced no case hit.
+    ddrb_word = DDRB_WORD_RE.search(text) if allow_ddrb and not has_ddrb_hit else None
+    if ddrb_word:
+        # Center the snippet on the word match that triggered this entry
+        snippet_idx = ddrb_word.start()
+        snippet_window = clean_text_fragment(
+            text[max(0, snippet_idx - 160) : min(len(text), snippet_idx + 200)]
+        )
+        if not snippet_window:
+            snippet_window = head_snippet
+        debug_lines = [
+            "[MISSING DDRB ID]",
+            f"File: {art.txt_path.name}",
+            f"Source: {source_value or art.source}",
+            f"Doc type: {doc_type_value or ''}",
+        ]
+        title_val = meta.get("title")
+        if title_val:
+            debug_lines.append(f"Title: {clean_text_fragment(str(title_val))}")
+        url_val = meta.get("url")
+        if url_val:
+            debug_lines.append(f"URL: {url_val}")
+        if snippet_window:
+            debug_lines.append(f"Snippet: {snippet_window}")
+        scan.debug_entries.append("\n".join(debug_lines))
+
+    scan.matches = matches
+    if matches:
+        if any(hit.project_type == "DIA-RES" for hit in matches):
+            scan.dia_snippet = build_dia_snippet(text, meta.get("url"))
+        scan.fallback_snippet = head_snippet
+    return scan
+
+
+def iter_artifact_scans(artifacts: Iterable[TextArtifact], workers: int) -> Iterable[ArtifactScan]:
+    """Scan artifacts in order, fanning the text work out to ``workers`` processes."""
+    if workers <= 1:
+        for art in artifacts:
+            yield scan_text_artifact(art)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(scan_text_artifact, artifacts, chunksize=4)
+
+
+def read_json(path: Path):
+    """Parse a JSON file, through orjson when it is installed."""
+    raw = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (NaN, lone surrogates); let json decide
+            pass
+    return json.loads(raw.decode("utf-8"))
 
 
 def load_index() -> List[dict]:
     if PROJECTS_INDEX.exists():
         try:
-            return json.loads(PROJECTS_INDEX.read_text(encoding="utf-8"))
+            return read_json(PROJECTS_INDEX)
         except Exception:
             pass
     return []
@@ -1156,20 +1567,33 @@ def load_index() -> List[dict]:
 
 def save_index(items: List[dict]) -> None:
     PROJECTS_DIR.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        try:
+            PROJECTS_INDEX.write_bytes(orjson.dumps(items, option=orjson.OPT_INDENT_2))
+            return
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; let json handle them
+            pass
     PROJECTS_INDEX.write_text(json.dumps(items, indent=2), encoding="utf-8")
 
 
+# ASCII non-digits, deleted when pulling the digits out of an identifier
+NON_DIGIT_ASCII = str.maketrans("", "", "".join(chr(c) for c in range(128) if not "0" <= chr(c) <= "9"))
+
+
 def normalize_dia_resolution(m: re.Match[str]) -> str:
-    raw = m.group("date") if "date" in m.groupdict() else m.group(1)
-    digits = re.sub(r"[^0-9]", "", raw)
+    raw = m.group("date") if "date" in m.re.groupindex else m.group(1)
+    # \d also matches non-ASCII digits, which only the regex drops
+    digits = raw.translate(NON_DIGIT_ASCII) if raw.isascii() else re.sub(r"[^0-9]", "", raw)
     if len(digits) < 8:
         return f"DIA-RES-{digits}"
     yyyy, mm, dd = digits[:4], digits[4:6], digits[6:8]
     return f"DIA-RES-{yyyy}-{mm}-{dd}"
 
 def normalize_ddrb_case(m: re.Match[str]) -> str:
-    yyyy = m.group("year") if "year" in m.groupdict() else m.group(1)
-    num = m.group("num") if "num" in m.groupdict() else m.group(2)
+    groups = m.re.groupindex
+    yyyy = m.group("year") if "year" in groups else m.group(1)
+    num = m.group("num") if "num" in groups else m.group(2)
     return f"DDRB-{yyyy}-{int(num):03d}"
 
 def detect_primary_id_from_meta(meta: dict) -> Optional[Tuple[str, str]]:
@@ -1190,23 +1614,35 @@ def detect_primary_id_from_meta(meta: dict) -> Optional[Tuple[str, str]]:
     return None
 
 
+def sorted_subdirs(directory: Path) -> List[os.DirEntry]:
+    """Sub-directories by name; DirEntry answers is_dir() from the directory listing."""
+    with os.scandir(directory) as entries:
+        return sorted((entry for entry in entries if entry.is_dir()), key=lambda entry: entry.name)
+
+
+def sorted_files_ending(directory: Path, suffix: str) -> List[Path]:
+    """Entries whose name ends with ``suffix``, sorted as glob("*" + suffix) would be."""
+    with os.scandir(directory) as entries:
+        return sorted(Path(entry.path) for entry in entries if entry.name.endswith(suffix))
+
+
 def iter_meta_items(source: Optional[str], year: Optional[str]) -> Iterable[Tuple[str, str, Path]]:
     """Yield (source, year, meta_path) for all meta JSON files."""
     if not FILES_DIR.exists():
         return []
-    for src_dir in sorted([p for p in FILES_DIR.iterdir() if p.is_dir()]):
+    for src_dir in sorted_subdirs(FILES_DIR):
         sid = src_dir.name
         if source and sid != source:
             continue
-        for ydir in sorted([p for p in src_dir.iterdir() if p.is_dir()]):
+        for ydir in sorted_subdirs(src_dir.path):
             yy = ydir.name
             if year and yy != year:
                 continue
             meta_candidates: List[Path] = []
-            mdir = ydir / "meta"
-            if mdir.exists():
-                meta_candidates.extend(sorted(mdir.glob("*.json")))
-            meta_candidates.extend(sorted(ydir.glob("*.meta.json")))
+            mdir = Path(ydir.path) / "meta"
+            if mdir.is_dir():
+                meta_candidates.extend(sorted_files_ending(mdir, ".json"))
+            meta_candidates.extend(sorted_files_ending(ydir.path, ".meta.json"))
             for mp in meta_candidates:
                 stem = mp.stem.lower()
                 if "sample" in stem:
@@ -1214,19 +1650,33 @@ def iter_meta_items(source: Optional[str], year: Optional[str]) -> Iterable[Tupl
                 yield sid, yy, mp
 
 
+def iter_parsed_meta_items(
+    source: Optional[str], year: Optional[str]
+) -> Iterable[Tuple[str, str, Path, Optional[dict]]]:
+    """iter_meta_items with each file parsed once; meta is None when unreadable."""
+    for sid, yy, mp in iter_meta_items(source, year):
+        try:
+            meta = read_json(mp)
+        except Exception:
+            meta = None
+        yield sid, yy, mp, meta
+
+
 def load_raw_year(source: str, year: str) -> List[dict]:
     fp = RAW_DIR / source / year / f"{source}.json"
     if not fp.exists():
         return []
     try:
-        data = json.loads(fp.read_text(encoding="utf-8"))
+        data = read_json(fp)
         return data.get("items", [])
     except Exception:
         return []
 
 
-def _dedupe_mentions(mentions: List[dict]) -> List[dict]:
-    seen: set[Tuple[str, str]] = set()
+def _dedupe_mentions(mentions: List[dict], seen: Optional[set[Tuple[str, str]]] = None) -> List[dict]:
+    """Drop mentions whose (url, id) key is already in ``seen``; ``seen`` is updated."""
+    if seen is None:
+        seen = set()
     out: List[dict] = []
     for m in mentions or []:
         url = (m.get("url") or "").strip()
@@ -1242,30 +1692,64 @@ def _dedupe_mentions(mentions: List[dict]) -> List[dict]:
     return out
 
 
-def upsert_project(index: List[dict], proj: dict) -> Tuple[List[dict], bool]:
-    """Insert or merge based on id. Merge mentions and fill missing fields."""
+@dataclass
+class IndexLookup:
+    """Lookups over an index list, kept in step with it by upsert_project."""
+
+    # Lower-cased project id -> first project with that id
+    by_id: Dict[str, dict] = field(default_factory=dict)
+    # Mention keys of projects whose mentions were already deduplicated
+    mention_keys: Dict[str, set[Tuple[str, str]]] = field(default_factory=dict)
+
+
+def build_index_lookup(index: List[dict]) -> IndexLookup:
+    lookup = IndexLookup()
+    for p in index:
+        lookup.by_id.setdefault((p.get("id") or "").lower(), p)
+    return lookup
+
+
+def upsert_project(
+    index: List[dict], proj: dict, lookup: Optional[IndexLookup] = None
+) -> Tuple[List[dict], bool]:
+    """Insert or merge based on id. Merge mentions and fill missing fields.
+
+    Callers upserting many projects into the same index pass a ``lookup``
+    (from build_index_lookup) so each upsert costs a dict hit and only the
+    incoming mentions are checked for duplicates.
+    """
     pid = (proj.get("id") or "").strip()
     if not pid:
         return index, False
-    for p in index:
-        if (p.get("id") or "").lower() == pid.lower():
-            # Merge mentions
-            if proj.get("mentions"):
-                p.setdefault("mentions", []).extend(proj["mentions"])
-                p["mentions"] = _dedupe_mentions(p["mentions"])  # Deduplicate by URL
-            # Prefer filling missing metadata
-            for k in ["title", "doc_type", "source", "meeting_date", "meeting_title"]:
-                if not p.get(k) and proj.get(k):
-                    p[k] = proj[k]
-            # Preserve existing pending_review unless explicitly provided
-            if "pending_review" in proj:
-                p["pending_review"] = bool(proj["pending_review"])
-            return index, False
+    if lookup is None:
+        lookup = build_index_lookup(index)
+    key = pid.lower()
+    p = lookup.by_id.get(key)
+    if p is not None:
+        # Merge mentions
+        if proj.get("mentions"):
+            seen = lookup.mention_keys.get(key)
+            if seen is None:
+                seen = lookup.mention_keys[key] = set()
+                p["mentions"] = _dedupe_mentions(p.get("mentions"), seen)  # Deduplicate by URL
+            p["mentions"].extend(_dedupe_mentions(proj["mentions"], seen))
+        # Prefer filling missing metadata
+        for k in ["title", "doc_type", "source", "meeting_date", "meeting_title"]:
+            if not p.get(k) and proj.get(k):
+                p[k] = proj[k]
+        # Preserve existing pending_review unless explicitly provided
+        if "pending_review" in proj:
+            p["pending_review"] = bool(proj["pending_review"])
+        return index, False
     # New entry
+    seen = set()
     proj.setdefault("mentions", [])
-    proj["mentions"] = _dedupe_mentions(proj["mentions"])  # Ensure unique URLs
+    proj["mentions"] = _dedupe_mentions(proj["mentions"], seen)  # Ensure unique URLs
     proj.setdefault("pending_review", True)
     index.append(proj)
+    new_key = (proj.get("id") or "").lower()
+    if lookup.by_id.setdefault(new_key, proj) is proj:
+        lookup.mention_keys[new_key] = seen
     return index, True
 
 
@@ -1414,38 +1898,39 @@ def validate_project_titles(index: List[dict]) -> None:
         )
 
 
+# Financial and administrative keywords, matched as substrings of the lowered title
+ADMIN_TITLE_TERMS = (
+    "debt reduction", "debt red", "ss fr ", "ss from ",
+    "budget", "amending the budget", # "budget" covers many
+    "unallocated", "appropriat", "allocating", "allocate", # "appropriat" covers appropriation/ing/ed/typos
+    "fund balance", "tid fund", "trust fund", "investment pool earnings",
+    "revenue", "earnings", "interest income",
+    "election of", "identifying the chair", "appointing",
+    "meeting minutes", "meeting agenda", "meeting packet",
+    "approving the minutes", "approving minutes",
+    "consent agenda", "ratification",
+    "financial report", "finance report",
+    "schedule of meetings",
+    "recognition", "appreciation", "sponsorship", "advertising",
+    "approving the 20", "adopting the 20", # Annual adoption things
+    "signature authorization", "professional services", "maintenance",
+
+
+    "cra annual report",
+    "declaring the official intent", # Bond issuances often
+    "authorizing the issuance", # Bonds
+    "pension fund",
+)
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
 def is_administrative_title(title: str) -> bool:
     """Check if a title indicates an administrative/financial resolution rather than a development project."""
     if not title:
         return False
     
     title_lower = title.lower()
-    
-    # Financial and administrative keywords
-    admin_terms = [
-        "debt reduction", "debt red", "ss fr ", "ss from ",
-        "budget", "amending the budget", # "budget" covers many
-        "unallocated", "appropriat", "allocating", "allocate", # "appropriat" covers appropriation/ing/ed/typos
-        "fund balance", "tid fund", "trust fund", "investment pool earnings",
-        "revenue", "earnings", "interest income",
-        "election of", "identifying the chair", "appointing",
-        "meeting minutes", "meeting agenda", "meeting packet",
-        "approving the minutes", "approving minutes",
-        "consent agenda", "ratification",
-        "financial report", "finance report",
-        "schedule of meetings",
-        "recognition", "appreciation", "sponsorship", "advertising",
-        "approving the 20", "adopting the 20", # Annual adoption things
-        "signature authorization", "professional services", "maintenance",
-
-
-        "cra annual report",
-        "declaring the official intent", # Bond issuances often
-        "authorizing the issuance", # Bonds
-        "pension fund",
-    ]
-    
-    return any(term in title_lower for term in admin_terms)
+    return any(term in title_lower for term in ADMIN_TITLE_TERMS)
 
 
 def remove_meeting_document_projects(index: List[dict]) -> Tuple[List[dict], int]:
@@ -1482,6 +1967,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     ap.add_argument("--year", help="Limit to a single year (YYYY)", default=None)
     ap.add_argument("--file", help="Process a single extracted text file (or PDF)", default=None)
     ap.add_argument("--reset", help="Recreate projects index file before writing", action="store_true")
+    ap.add_argument("--workers", type=int, default=None, help="Processes for the text scan (default: CPU count)")
     ap.add_argument("--cleanup-titles", help="(deprecated) Title cleanup now runs automatically", action="store_true")
     ap.add_argument("--remove-meeting-docs", help="(deprecated) Cleanup now runs automatically", action="store_true")
     args = ap.parse_args(argv)
@@ -1521,9 +2007,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         print("ℹ️  --cleanup-titles is now automatic; flag retained for compatibility.")
         
     created = 0
-    ddrb_debug_entries: List[str] = []
     timestamp = datetime.now().isoformat()
-    ddrb_debug_entries.append(f"[EXTRACTION RUN] {timestamp}\n")
 
     if args.file:
         index, added, exit_code = process_single_project_file(Path(args.file), index)
@@ -1533,11 +2017,13 @@ def main(argv: Optional[List[str]] = None) -> int:
             save_index(index)
         return exit_code
 
+    lookup = build_index_lookup(index)
+
     # Prefer meta-only scan first (reference_only mode)
-    for sid, yy, mp in iter_meta_items(args.source, args.year):
-        try:
-            meta = json.loads(mp.read_text(encoding="utf-8"))
-        except Exception:
+    # Parsed once here and reused by the text-artifact pass below
+    meta_items = list(iter_parsed_meta_items(args.source, args.year))
+    for sid, yy, mp, meta in meta_items:
+        if meta is None:
             continue
         det = detect_primary_id_from_meta(meta)
         if not det:
@@ -1594,7 +2080,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         if is_administrative_title(proj["title"]) or is_meeting_document(proj["title"]):
             continue
 
-        index, is_new = upsert_project(index, proj)
+        index, is_new = upsert_project(index, proj, lookup)
         if is_new:
             created += 1
             print(f"➕ New project: {proj['id']} ({proj.get('title','')}) with {len(proj['mentions'])} mention(s)")
@@ -1607,7 +2093,8 @@ def main(argv: Optional[List[str]] = None) -> int:
             # Find all years for this source
             source_dir = RAW_DIR / raw_source
             if source_dir.exists():
-                source_years = [d.name for d in source_dir.iterdir() if d.is_dir() and d.name.isdigit()]
+                with os.scandir(source_dir) as entries:
+                    source_years = [d.name for d in entries if d.name.isdigit() and d.is_dir()]
 
         for year in source_years:
             raw_items = load_raw_year(raw_source, year)
@@ -1631,6 +2118,9 @@ def main(argv: Optional[List[str]] = None) -> int:
                         case_num = ddrb_match.group("num")
                         pid = f"DDRB-{case_year}-{case_num.zfill(3)}"
                         project_title = title or f"DDRB Case {case_year}-{case_num}"
+                        meeting_date = item.get("meeting_date")
+                        meeting_title = item.get("meeting_title")
+                        snippet = title[:200] if title else ""
 
                         # Create DDRB project for actual development cases
                         mention = {
@@ -1640,9 +2130,9 @@ def main(argv: Optional[List[str]] = None) -> int:
                             "doc_type": doc_type or "case",
                             "source": raw_source,
                             "source_name": "DDRB" if raw_source == "dia_ddrb" else "DIA Board",
-                            "meeting_date": item.get("meeting_date"),
-                            "meeting_title": item.get("meeting_title"),
-                            "snippet": title[:200] if title else ""
+                            "meeting_date": meeting_date,
+                            "meeting_title": meeting_title,
+                            "snippet": snippet
                         }
 
                         proj = {
@@ -1650,13 +2140,13 @@ def main(argv: Optional[List[str]] = None) -> int:
                             "title": project_title,
                             "doc_type": "DDRB",
                             "source": raw_source,
-                            "meeting_date": item.get("meeting_date"),
-                            "meeting_title": item.get("meeting_title"),
+                            "meeting_date": meeting_date,
+                            "meeting_title": meeting_title,
                             "mentions": [mention],
                             "pending_review": True,
                         }
 
-                        index, is_new = upsert_project(index, proj)
+                        index, is_new = upsert_project(index, proj, lookup)
                         if is_new:
                             created += 1
                             print(f"➕ New DDRB project: {proj['id']} ({proj.get('title','')})")
@@ -1671,6 +2161,9 @@ def main(argv: Optional[List[str]] = None) -> int:
                         year_str, month_str, day_str = parts[2], parts[3], parts[4]
                     else:
                         year_str, month_str, day_str = pid, "", ""
+                    meeting_date = item.get("meeting_date")
+                    meeting_title = item.get("meeting_title")
+                    snippet = title[:200] if title else ""
 
                     mention = {
                         "id": pid,
@@ -1679,9 +2172,9 @@ def main(argv: Optional[List[str]] = None) -> int:
                         "doc_type": doc_type or "resolution",
                         "source": raw_source,
                         "source_name": "DIA Board",
-                        "meeting_date": item.get("meeting_date"),
-                        "meeting_title": item.get("meeting_title"),
-                        "snippet": title[:200] if title else ""
+                        "meeting_date": meeting_date,
+                        "meeting_title": meeting_title,
+                        "snippet": snippet
                     }
 
                     proj = {
@@ -1689,157 +2182,85 @@ def main(argv: Optional[List[str]] = None) -> int:
                         "title": title or f"DIA Resolution {year_str}-{month_str}-{day_str}",
                         "doc_type": "DIA-RES",
                         "source": raw_source,
-                        "meeting_date": item.get("meeting_date"),
-                        "meeting_title": item.get("meeting_title"),
+                        "meeting_date": meeting_date,
+                        "meeting_title": meeting_title,
                         "mentions": [mention],
                         "pending_review": True,
                     }
 
-                    index, is_new = upsert_project(index, proj)
+                    index, is_new = upsert_project(index, proj, lookup)
                     if is_new:
                         created += 1
                         print(f"➕ New DIA project: {proj['id']} ({proj.get('title','')})")
 
     # Also scan PDFs (if any downloaded) for primary-ID reinforcement and add snippet context
-    for art in iter_text_artifacts(args.source, args.year):
-        try:
-            meta = json.loads(art.meta_path.read_text(encoding="utf-8"))
-            text = art.txt_path.read_text(encoding="utf-8", errors="ignore")
-        except Exception as e:
-            if art.source == "dia_ddrb":
-                ddrb_debug_entries.append(f"[ERROR] Failed to read {art.txt_path}: {e}")
-            continue
-
-        # Skip HTML-heavy content for DDRB processing
-        source_value = (meta.get("source") or art.source or "").strip()
-        if source_value.lower() == "dia_ddrb":
-            if is_html_content(text):
-                debug_lines = [
-                    "[SKIPPED HTML]",
-                    f"File: {art.txt_path.name}",
-                    f"Reason: HTML/JavaScript content detected",
-                ]
-                title_val = meta.get("title")
-                if title_val:
-                    debug_lines.append(f"Title: {clean_text_fragment(str(title_val))}")
-                url_val = meta.get("url")
-                if url_val:
-                    debug_lines.append(f"URL: {url_val}")
-                ddrb_debug_entries.append("\n".join(debug_lines))
+    artifacts = list(iter_text_artifacts(args.source, args.year, meta_items))
+    workers = min(args.workers or os.cpu_count() or 1, max(1, len(artifacts)))
+    # Always write debug log for DDRB processing; entries are appended to the
+    # existing log (or a new one) as each artifact is scanned
+    DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+    with open(DDRB_DEBUG_LOG, "a", encoding="utf-8") as debug_log:
+        debug_log.write(f"[EXTRACTION RUN] {timestamp}\n\n\n")
+        for scan in iter_artifact_scans(artifacts, workers):
+            debug_log.writelines(f"{entry}\n\n" for entry in scan.debug_entries)
+            if scan.skipped:
+                continue
+            art, meta, source_value = scan.artifact, scan.meta, scan.source_value
+            matches = scan.matches
+            # Insertion-ordered set of DDRB ids matched in this artifact
+            ddrb_ids_for_file: Dict[str, None] = {}
+
+            if not matches:
+                if scan.is_dia_ddrb:
+                    debug_log.write(f"[NO DDRB] {art.txt_path}\n\n")
                 continue
-            if is_short_text(text):
-                debug_lines = [
-                    "[SHORT TEXT]",
-                    f"File: {art.txt_path.name}",
-                    f"Length: {len(clean_text_fragment(text))} characters",
-                ]
-                title_val = meta.get("title")
-                if title_val:
-                    debug_lines.append(f"Title: {clean_text_fragment(str(title_val))}")
-                url_val = meta.get("url")
-                if url_val:
-                    debug_lines.append(f"URL: {url_val}")
-                ddrb_debug_entries.append("\n".join(debug_lines))
-
-        doc_type_value = meta.get("doc_type")
-        matches = extract_matches_from_text(text, doc_type_value, meta.get("source") or art.source)
-        ddrb_ids_for_file: List[str] = []
-
-        doc_type_norm = normalize_doc_type(doc_type_value)
-        allow_ddrb = doc_type_norm in MENTION_DOC_TYPES or source_value.lower() in DDRB_SOURCE_IDS
-        text_has_ddrb = bool(re.search(r"\bDDRB\b", text, re.I))
-        has_ddrb_hit = any(hit.project_type == "DDRB" for hit in matches)
-
-        if allow_ddrb and text_has_ddrb and not has_ddrb_hit:
-            snippet_idx = text.upper().find("DDRB")
-            snippet_window = ""
-            if snippet_idx != -1:
-                snippet_window = clean_text_fragment(
-                    text[max(0, snippet_idx - 160) : min(len(text), snippet_idx + 200)]
-                )
-            if not snippet_window:
-                snippet_window = clean_text_fragment(text[:200])
-            debug_lines = [
-                "[MISSING DDRB ID]",
-                f"File: {art.txt_path.name}",
-                f"Source: {source_value or art.source}",
-                f"Doc type: {doc_type_value or ''}",
-            ]
-            title_val = meta.get("title")
-            if title_val:
-                debug_lines.append(f"Title: {clean_text_fragment(str(title_val))}")
-            url_val = meta.get("url")
-            if url_val:
-                debug_lines.append(f"URL: {url_val}")
-            if snippet_window:
-                debug_lines.append(f"Snippet: {snippet_window}")
-            ddrb_debug_entries.append("\n".join(debug_lines))
-
-        if not matches:
-            if source_value.lower() == "dia_ddrb":
-                ddrb_debug_entries.append(f"[NO DDRB] {art.txt_path}")
-            continue
 
-        dia_snippet = build_dia_snippet(text, meta.get("url"))
-        fallback_snippet = clean_text_fragment(text[:200])
+            dia_snippet = scan.dia_snippet
+            fallback_snippet = scan.fallback_snippet
 
-        for hit in matches:
-            if hit.candidate_title and (is_administrative_title(hit.candidate_title) or is_meeting_document(hit.candidate_title)):
-                continue
+            for hit in matches:
+                if hit.candidate_title and (is_administrative_title(hit.candidate_title) or is_meeting_document(hit.candidate_title)):
+                    continue
             
-            snippet = dia_snippet if hit.project_type == "DIA-RES" else hit.context
-            if not snippet:
-                snippet = fallback_snippet
-            mention = make_mention(meta, hit.project_id, snippet=snippet, page=hit.page_number, anchor_id=hit.anchor_id, financials=hit.financials)
-            if not mention:
-                continue
-            project_title = hit.candidate_title or meta.get("title") or hit.project_id
+                snippet = dia_snippet if hit.project_type == "DIA-RES" else hit.context
+                if not snippet:
+                    snippet = fallback_snippet
+                mention = make_mention(meta, hit.project_id, snippet=snippet, page=hit.page_number, anchor_id=hit.anchor_id, financials=hit.financials)
+                if not mention:
+                    continue
+                project_title = hit.candidate_title or meta.get("title") or hit.project_id
             
-            if is_administrative_title(project_title) or is_meeting_document(project_title):
-                continue
+                # A candidate title was already checked above; only fallbacks need it here
+                if not hit.candidate_title and (is_administrative_title(project_title) or is_meeting_document(project_title)):
+                    continue
                 
-            payload = {
-                "id": hit.project_id,
-                "title": project_title,
-                "doc_type": hit.project_type,
-                "source": source_value or art.source,
-                "meeting_date": meta.get("meeting_date"),
-                "meeting_title": meta.get("meeting_title"),
-                "mentions": [mention],
-            }
-            if hit.project_type == "DDRB":
-                ddrb_ids_for_file.append(hit.project_id)
-            index, is_new = upsert_project(index, payload)
-            if is_new:
-                created += 1
-                print(
-                    f"➕ New project: {payload['id']} ({payload.get('title','')}) "
-                    f"from text in {meta.get('source') or art.source}"
-                )
-        if source_value.lower() == "dia_ddrb":
-            if ddrb_ids_for_file:
-                for pid in sorted(set(ddrb_ids_for_file)):
-                    ddrb_debug_entries.append(f"[MATCH DDRB] {pid} from {art.txt_path}")
-            else:
-                ddrb_debug_entries.append(f"[NO DDRB] {art.txt_path}")
-    # Always write debug log for DDRB processing
-    DEBUG_DIR.mkdir(parents=True, exist_ok=True)
-
-    # Append to existing log if it exists, otherwise create new
-    debug_content = "\n\n".join(ddrb_debug_entries) + "\n\n"
-
-    if DDRB_DEBUG_LOG.exists():
-        # Append to existing log
-        with open(DDRB_DEBUG_LOG, "a", encoding="utf-8") as f:
-            f.write(debug_content)
-    else:
-        # Create new log
-        DDRB_DEBUG_LOG.write_text(debug_content, encoding="utf-8")
+                payload = {
+                    "id": hit.project_id,
+                    "title": project_title,
+                    "doc_type": hit.project_type,
+                    "source": source_value or art.source,
+                    "meeting_date": meta.get("meeting_date"),
+                    "meeting_title": meta.get("meeting_title"),
+                    "mentions": [mention],
+                }
+                if hit.project_type == "DDRB":
+                    ddrb_ids_for_file[hit.project_id] = None
+                index, is_new = upsert_project(index, payload, lookup)
+                if is_new:
+                    created += 1
+                    print(
+                        f"➕ New project: {payload['id']} ({payload.get('title','')}) "
+                        f"from text in {meta.get('source') or art.source}"
+                    )
+            if scan.is_dia_ddrb:
+                if ddrb_ids_for_file:
+                    for pid in ddrb_ids_for_file:
+                        debug_log.write(f"[MATCH DDRB] {pid} from {art.txt_path}\n\n")
+                else:
+                    debug_log.write(f"[NO DDRB] {art.txt_path}\n\n")
 
-    ddrb_project_count = sum(1 for p in index if (p.get("id") or "").upper().startswith("DDRB-"))
-    ddrb_summary = f"\n[SUMMARY] Found {ddrb_project_count} DDRB project(s) in index"
-    with open(DDRB_DEBUG_LOG, "a", encoding="utf-8") as f:
-        f.write(ddrb_summary)
+        ddrb_project_count = sum(1 for p in index if (p.get("id") or "").upper().startswith("DDRB-"))
+        debug_log.write(f"\n[SUMMARY] Found {ddrb_project_count} DDRB project(s) in index")
 
     index, cleaned_count = cleanup_project_titles(index)
     if cleaned_count:
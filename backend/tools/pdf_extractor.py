@@ -12,7 +12,7 @@ Outputs per item kept depend on the artifact policy:
 - parse_then_discard: text saved to outputs/files/<source>/<YYYY>/<filename>.pdf.txt and metadata saved under outputs/files/<source>/<YYYY>/meta/*.json without retaining the PDF
 
 CLI:
-  python3 -m backend.tools.pdf_extractor [--source ID] [--year YYYY] [--force]
+  python3 -m backend.tools.pdf_extractor [--source ID] [--year YYYY] [--force] [--workers N] [--text-workers N]
 """
 
 from __future__ import annotations
@@ -20,11 +20,17 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import multiprocessing
+import os
 import re
 import sys
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Optional
 from urllib.parse import urlparse, parse_qs
@@ -32,12 +38,29 @@ from urllib.parse import urlparse, parse_qs
 import requests
 import pdfplumber
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:  # pragma: no cover - optional dependency (installed with pdfplumber>=0.11)
+    import pypdfium2 as pdfium  # type: ignore
+except ImportError:  # pragma: no cover
+    pdfium = None
 
 
 RAW_DIR = Path("outputs/raw")
 FILES_DIR = Path("outputs/files")
 DEBUG_DIR = Path("outputs/debug")
 PDF_DEBUG_LOG = DEBUG_DIR / "pdf_extractor.log"
+TEXT_CACHE_DIR = Path("outputs/cache/pdf_text")
+# Concurrent downloads/HEADs per raw file; network round trips dominate a run
+DOWNLOAD_WORKERS = 8
+# Keep-alive connections per host shared by the download workers
+HTTP_POOL_SIZE = 32
 
 
 @dataclass
@@ -98,6 +121,10 @@ def iter_raw_files(source: Optional[str] = None, year: Optional[str] = None) ->
 
 
 LEGISTAR_VIEW_RE = re.compile(r"view\.ashx", re.I)
+# Filename sanitizing, compiled once instead of per item
+HAS_ALNUM_RE = re.compile(r"[a-z0-9]", re.I)
+UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9._-]")
+NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]")
 
 
 def is_cms_getattachment(url: str) -> bool:
@@ -126,7 +153,7 @@ def is_pdf_like(url: str) -> bool:
 def make_filename(item: dict) -> str:
     # Prefer explicit filename if it ends with .pdf
     fn = (item.get("filename") or "").strip()
-    if fn.lower().endswith(".pdf") and re.search(r"[a-z0-9]", fn, re.I):
+    if fn.lower().endswith(".pdf") and HAS_ALNUM_RE.search(fn):
         return fn
     # Derive from URL
     url = item.get("url") or ""
@@ -148,8 +175,8 @@ def make_filename(item: dict) -> str:
         if not name:
             # Fallback slug from URL hash
             name = hashlib.md5(url.encode("utf-8")).hexdigest()[:10]
-        base = re.sub(r"[^a-zA-Z0-9._-]", "_", name)
-        gid = re.sub(r"[^a-zA-Z0-9]", "", guid)[:36]
+        base = UNSAFE_FILENAME_CHARS_RE.sub("_", name)
+        gid = NON_ALNUM_RE.sub("", guid)[:36]
         stem = f"getattachment_{gid}_{base}" if gid else f"getattachment_{base}"
         if not stem.lower().endswith(".pdf"):
             stem += ".pdf"
@@ -168,45 +195,204 @@ def make_filename(item: dict) -> str:
     return f"view{mid}{did}_{h}.pdf"
 
 
+def temp_sibling(path: Path) -> Path:
+    """Temp name next to ``path``, unique per process and thread, for write-then-replace."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` via a temp file and os.replace.
+
+    A crash mid-write leaves the previous file (or none) in place, so the next
+    run's exists() checks never mistake a truncated file for a finished one.
+    """
+    tmp_path = temp_sibling(path)
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+
+def read_json(path: Path):
+    """Parse a JSON file, through orjson when it is installed."""
+    raw = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (NaN, lone surrogates); let json decide
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
+def write_json(path: Path, data: dict) -> None:
+    """Write ``data`` as indented JSON, through orjson when it is installed."""
+    if orjson is not None:
+        try:
+            atomic_write_bytes(path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
+        except orjson.JSONEncodeError:
+            # e.g. lone surrogates or ints beyond 64 bits; json handles those
+            pass
+    atomic_write_text(path, json.dumps(data, indent=2))
+
+
+def dumps_event(event: dict) -> str:
+    """Serialize a debug event as one sorted-key JSON line."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(event, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(event, sort_keys=True)
+
+
+# One append handle for the whole run, opened on the first event; download
+# workers share it under the lock so their lines never interleave.
+_debug_log = None
+_debug_log_lock = threading.Lock()
+
+
 def record_debug_event(payload: dict) -> None:
+    global _debug_log
     try:
-        DEBUG_DIR.mkdir(parents=True, exist_ok=True)
         event = dict(payload)
         event.setdefault("timestamp", datetime.now().isoformat())
-        with PDF_DEBUG_LOG.open("a", encoding="utf-8") as fp:
-            fp.write(json.dumps(event, sort_keys=True) + "\n")
+        line = dumps_event(event) + "\n"
+        with _debug_log_lock:
+            if _debug_log is None:
+                DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+                # Line-buffered, so every event is on disk as soon as it is written
+                _debug_log = PDF_DEBUG_LOG.open("a", encoding="utf-8", buffering=1)
+            _debug_log.write(line)
     except Exception:
         pass
 
 
-def save_binary(url: str, dest: Path, timeout: float = 45.0) -> tuple[bool, int, str, dict, str]:
+def close_debug_log() -> None:
+    global _debug_log
+    with _debug_log_lock:
+        if _debug_log is not None:
+            _debug_log.close()
+            _debug_log = None
+
+
+def make_http_session(pool_maxsize: int = HTTP_POOL_SIZE) -> requests.Session:
+    """Session whose keep-alive pool is shared by all download/HEAD workers.
+
+    Most artifacts come from a handful of Legistar/SharePoint/DIA hosts, so
+    reusing connections saves a TCP+TLS handshake per request.
+    """
+    session = requests.Session()
+    # Retry-After is ignored so one throttling host cannot park a download
+    # worker for however long it asks; the short backoff still applies.
+    retries = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+        raise_on_status=False,
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+HTTP_SESSION = make_http_session()
+
+
+def save_binary(
+    url: str, dest: Path, timeout: float = 45.0, extra_headers: Optional[dict] = None
+) -> tuple[bool, int, str, dict, str, str]:
     """Download binary with streaming and simple content-type validation.
 
-    Returns (ok, status_code, content_type). When ok is False, file is not saved.
+    Returns (ok, status_code, content_type, headers, final_url, sha256). When ok
+    is False, file is not saved and sha256 is empty; otherwise it is the hex
+    digest of the saved bytes, hashed while streaming.
     For cms/getattachment and .pdf URLs, we expect application/pdf content-type.
+    ``extra_headers`` carries conditional-GET validators; a 304 saves nothing.
     """
     dest.parent.mkdir(parents=True, exist_ok=True)
+    headers = {"User-Agent": "JaxWatchPDF/1.0", **(extra_headers or {})}
     try:
-        with requests.get(url, stream=True, timeout=timeout, headers={"User-Agent": "JaxWatchPDF/1.0"}) as r:
+        with HTTP_SESSION.get(url, stream=True, timeout=timeout, headers=headers) as r:
             status = r.status_code
             ctype = r.headers.get("Content-Type", "") or ""
             final_url = str(r.url)
             if status != 200:
-                return False, status, ctype, dict(r.headers), final_url
+                return False, status, ctype, dict(r.headers), final_url, ""
             # If explicitly a PDF URL or CMS getattachment, ensure content-type is PDF when provided
             if (url.lower().endswith(".pdf") or is_cms_getattachment(url)) and ("pdf" not in ctype.lower() and ctype != ""):
                 # Not a PDF
-                return False, status, ctype, dict(r.headers), final_url
-            with open(dest, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-            return True, status, ctype, dict(r.headers), final_url
+                return False, status, ctype, dict(r.headers), final_url, ""
+            digest = hashlib.sha256()
+            # Stream into a temp file so an interrupted download never leaves a
+            # truncated PDF at dest for a later 304 revalidation to keep
+            tmp_path = temp_sibling(dest)
+            try:
+                with open(tmp_path, "wb") as f:
+                    for chunk in r.iter_content(chunk_size=8192):
+                        if chunk:
+                            f.write(chunk)
+                            digest.update(chunk)
+                os.replace(tmp_path, dest)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            return True, status, ctype, dict(r.headers), final_url, digest.hexdigest()
     except Exception:
-        return False, -1, "", {}, url
+        return False, -1, "", {}, url, ""
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# pdfium is not thread-safe; download workers that extract inline (no text
+# pool) take turns under this lock.
+_pdfium_lock = threading.Lock()
+
+
+def extract_text_pdfium(pdf_path: Path) -> str:
+    """Extract page-marked text with pypdfium2, closing each page as it goes."""
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    try:
+        texts: List[str] = []
+        for i in range(len(pdf)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            try:
+                t = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+            t = t.replace("\r\n", "\n").replace("\r", "\n")
+            texts.append(f"[[PAGE {i+1}]]\n{t}")
+        return "\n\n".join(texts)
+    finally:
+        pdf.close()
 
 
 def extract_text(pdf_path: Path) -> str:
+    # pdfium is much faster for plain text; pdfplumber covers files it rejects
+    if pdfium is not None:
+        try:
+            with _pdfium_lock:
+                return extract_text_pdfium(pdf_path)
+        except Exception:
+            pass
     try:
         with pdfplumber.open(str(pdf_path)) as pdf:
             texts: List[str] = []
@@ -223,6 +409,72 @@ def extract_text(pdf_path: Path) -> str:
             return ""
 
 
+class TextExtractionPool:
+    """Process pool for extract_text that replaces itself when a worker dies.
+
+    A PDF that crashes the parser breaks the whole executor, failing every
+    pending job with it, so a broken pool is swapped for a fresh one and the
+    job retried once. Workers are spawned rather than forked because the pool
+    is first used from the download threads.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._pool = self._start()
+
+    def _start(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def extract(self, pdf_path: Path) -> str:
+        for _ in range(2):
+            pool = self._pool
+            try:
+                return pool.submit(extract_text, pdf_path).result()
+            except BrokenProcessPool:
+                with self._lock:
+                    if self._pool is pool:
+                        pool.shutdown(wait=False)
+                        self._pool = self._start()
+        raise RuntimeError(f"text extraction worker crashed on '{pdf_path}'")
+
+    def shutdown(self) -> None:
+        self._pool.shutdown()
+
+
+def run_extract_text(pdf_path: Path, text_pool: Optional[TextExtractionPool] = None) -> str:
+    """Run extract_text inline, or on ``text_pool`` so PDF parsing runs outside the GIL."""
+    if text_pool is None:
+        return extract_text(pdf_path)
+    return text_pool.extract(pdf_path)
+
+
+def extract_text_cached(
+    pdf_path: Path, sha256: str, force: bool = False, text_pool: Optional[TextExtractionPool] = None
+) -> str:
+    """Extract text for a downloaded PDF, reusing text cached under its content hash.
+
+    The same PDF often turns up under several URLs or filenames, so the cache is
+    keyed by the SHA-256 of its bytes. ``force`` re-extracts and refreshes it.
+    """
+    if not sha256:
+        return run_extract_text(pdf_path, text_pool)
+    cache_path = TEXT_CACHE_DIR / f"{sha256}.txt"
+    if not force:
+        try:
+            return cache_path.read_text(encoding="utf-8")
+        except OSError:
+            pass
+    text = run_extract_text(pdf_path, text_pool)
+    try:
+        TEXT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(cache_path, text)
+    except Exception as exc:
+        print(f"⚠️  Could not cache extracted text for '{pdf_path}': {exc}")
+    return text
+
+
+@lru_cache(maxsize=1)
 def load_artifact_policy() -> dict:
     cfg_path = Path("backend/collector/sources.yaml")
     try:
@@ -240,205 +492,289 @@ def load_artifact_policy() -> dict:
 
 def head_metadata(url: str, timeout: float = 30.0) -> tuple[int, dict, str]:
     try:
-        resp = requests.head(url, allow_redirects=True, timeout=timeout, headers={"User-Agent": "JaxWatchPDF/1.0"})
+        resp = HTTP_SESSION.head(url, allow_redirects=True, timeout=timeout, headers={"User-Agent": "JaxWatchPDF/1.0"})
         return resp.status_code, dict(resp.headers), str(resp.url)
     except Exception:
         return -1, {}, url
 
 
+def load_fetched_meta(meta_path: Path) -> dict:
+    """Meta from an earlier successful fetch, or {} when there is nothing to revalidate."""
+    try:
+        prior = read_json(meta_path)
+    except Exception:
+        return {}
+    if not isinstance(prior, dict) or prior.get("status_code") != 200:
+        return {}
+    return prior
+
+
+def conditional_headers(prior: dict) -> dict:
+    """If-None-Match / If-Modified-Since validators recorded in ``prior`` meta."""
+    headers = {}
+    if prior.get("etag"):
+        headers["If-None-Match"] = prior["etag"]
+    if prior.get("last_modified"):
+        headers["If-Modified-Since"] = prior["last_modified"]
+    return headers
+
+
+def refresh_unchanged_meta(meta_path: Path, prior: dict, item: dict) -> bool:
+    """Keep the fetch details of an artifact the server reports unchanged; bump saved_at."""
+    meta = {**prior, **item, "saved_at": datetime.now().isoformat()}
+    try:
+        write_json(meta_path, meta)
+    except Exception as e:
+        print(f"⚠️  Failed writing meta for {item.get('url') or ''}: {e}")
+        return False
+    return True
+
+
 def meta_filename(item: dict) -> str:
     # Base on the PDF filename stem even in reference-only mode
     stem = make_filename(item)
     if stem.lower().endswith('.pdf'):
         stem = stem[:-4]
-    safe = re.sub(r"[^a-zA-Z0-9._-]", "_", stem)
+    safe = UNSAFE_FILENAME_CHARS_RE.sub("_", stem)
     return f"{safe}.json"
 
 
-def process_file(raw: RawFile, policy_map: dict[str, str], force: bool = False) -> tuple[int, int]:
-    created_downloads = 0
-    created_meta_only = 0
-    try:
-        data = json.load(raw.path.open("r"))
-    except Exception as e:
-        print(f"⚠️  Failed to read {raw.path}: {e}")
-        return 0, 0
-    items = data.get("items", [])
-    year = data.get("year") or raw.year
-    source_id = data.get("source") or raw.source
-    policy = policy_map.get(source_id, "reference_only")
+def process_item(
+    it: dict,
+    source: str,
+    year: str,
+    policy: str,
+    meta_dir: Path,
+    force: bool = False,
+    text_pool: Optional[TextExtractionPool] = None,
+) -> tuple[int, int]:
+    """Fetch one PDF-like item per ``policy``; returns (downloads, meta_only) created."""
+    url = it.get("url") or ""
+
+    if policy == "reference_only":
+        # HEAD only and save meta
+        mfn = meta_filename(it)
+        mpath = meta_dir / mfn
+        if mpath.exists() and not force:
+            return 0, 0
+        status_code, headers, final_url = head_metadata(url)
+        meta = dict(it)
+        meta.update({
+            "saved_at": datetime.now().isoformat(),
+            "status_code": status_code,
+            "content_type": headers.get("Content-Type", ""),
+            "content_length": headers.get("Content-Length", ""),
+            "last_modified": headers.get("Last-Modified", ""),
+            "etag": headers.get("ETag", ""),
+            "final_url": final_url,
+        })
+        try:
+            write_json(mpath, meta)
+            print(f"🛈 Saved meta for {source}/{year}: {mfn} (status={status_code})")
+        except Exception as e:
+            print(f"⚠️  Failed writing meta for {url}: {e}")
+            return 0, 0
+        return 0, 1
 
-    meta_dir = FILES_DIR / source_id / str(year) / "meta"
-    if policy in {"reference_only", "parse_then_discard"}:
+    if policy == "parse_then_discard":
+        fn = make_filename(it)
+        out_dir = FILES_DIR / source / str(year)
+        out_dir.mkdir(parents=True, exist_ok=True)
         meta_dir.mkdir(parents=True, exist_ok=True)
-    for it in items:
-        url = it.get("url") or ""
-        if not is_pdf_like(url):
-            continue
-        source = source_id
-
-        if policy == "reference_only":
-            # HEAD only and save meta
-            mfn = meta_filename(it)
-            mpath = meta_dir / mfn
-            if mpath.exists() and not force:
-                continue
-            status_code, headers, final_url = head_metadata(url)
-            meta = dict(it)
-            meta.update({
-                "saved_at": datetime.now().isoformat(),
-                "status_code": status_code,
-                "content_type": headers.get("Content-Type", ""),
-                "content_length": headers.get("Content-Length", ""),
-                "last_modified": headers.get("Last-Modified", ""),
-                "etag": headers.get("ETag", ""),
-                "final_url": final_url,
-            })
-            try:
-                mpath.write_text(json.dumps(meta, indent=2), encoding="utf-8")
-                created_meta_only += 1
-                print(f"🛈 Saved meta for {source}/{year}: {mfn} (status={status_code})")
-            except Exception as e:
-                print(f"⚠️  Failed writing meta for {url}: {e}")
-            continue
-
-        if policy == "parse_then_discard":
-            fn = make_filename(it)
-            out_dir = FILES_DIR / source / str(year)
-            out_dir.mkdir(parents=True, exist_ok=True)
-            meta_dir.mkdir(parents=True, exist_ok=True)
-            txt_path = out_dir / (fn + ".txt")
-            mfn = meta_filename(it)
-            meta_path = meta_dir / mfn
-            if txt_path.exists() and meta_path.exists() and not force:
-                continue
-            with tempfile.TemporaryDirectory() as tmpdir:
-                temp_pdf = Path(tmpdir) / fn
-                ok, status_code, content_type, headers, final_url = save_binary(url, temp_pdf)
-                if not ok:
-                    print(f"⚠️  Skipping parse-only artifact (status={status_code} ctype='{content_type}') for {url}")
-                    failure_meta = dict(it)
-                    failure_meta.update({
-                        "saved_at": datetime.now().isoformat(),
-                        "status_code": status_code,
-                        "content_type": content_type,
-                        "headers": headers,
-                        "final_url": final_url,
-                        "failure_stage": "download",
-                        "failure_reason": "non_pdf_response" if "pdf" not in (content_type or "").lower() else "http_error",
-                    })
-                    try:
-                        meta_path.write_text(json.dumps(failure_meta, indent=2), encoding="utf-8")
-                    except Exception as e:
-                        print(f"⚠️  Failed writing failure meta for {url}: {e}")
-                    record_debug_event({
-                        "event": "download_failed",
-                        "source": source,
-                        "year": year,
-                        "url": url,
-                        "status_code": status_code,
-                        "content_type": content_type,
-                        "final_url": final_url,
-                        "policy": policy,
-                    })
-                    continue
+        txt_path = out_dir / (fn + ".txt")
+        mfn = meta_filename(it)
+        meta_path = meta_dir / mfn
+        if txt_path.exists() and meta_path.exists() and not force:
+            return 0, 0
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp_pdf = Path(tmpdir) / fn
+            ok, status_code, content_type, headers, final_url, sha256 = save_binary(url, temp_pdf)
+            if not ok:
+                print(f"⚠️  Skipping parse-only artifact (status={status_code} ctype='{content_type}') for {url}")
+                failure_meta = dict(it)
+                failure_meta.update({
+                    "saved_at": datetime.now().isoformat(),
+                    "status_code": status_code,
+                    "content_type": content_type,
+                    "headers": headers,
+                    "final_url": final_url,
+                    "failure_stage": "download",
+                    "failure_reason": "non_pdf_response" if "pdf" not in (content_type or "").lower() else "http_error",
+                })
                 try:
-                    text = extract_text(temp_pdf)
+                    write_json(meta_path, failure_meta)
                 except Exception as e:
-                    print(f"⚠️  Text extraction failed for temp PDF {temp_pdf}: {e}")
-                    text = ""
-            try:
-                txt_path.write_text(text, encoding="utf-8")
-            except Exception as e:
-                print(f"⚠️  Failed writing text for {url}: {e}")
-                continue
-
-            meta = dict(it)
-            meta.update({
-                "saved_at": datetime.now().isoformat(),
-                "status_code": status_code,
-                "content_type": content_type,
-                "content_length": (headers or {}).get("Content-Length", ""),
-                "last_modified": (headers or {}).get("Last-Modified", ""),
-                "etag": (headers or {}).get("ETag", ""),
-                "final_url": final_url,
-                "local_text_path": str(txt_path),
-            })
-            try:
-                meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
-            except Exception as e:
-                print(f"⚠️  Failed writing meta for {url}: {e}")
-                continue
-            created_downloads += 1
-            print(f"✅ Parsed + discarded PDF for {source}/{year}: {fn}")
-            continue
-
-        # Download policy
-        fn = make_filename(it)
-        out_dir = FILES_DIR / source / str(year)
-        pdf_path = out_dir / fn
-        txt_path = pdf_path.with_name(pdf_path.name + ".txt")
-        meta_path = pdf_path.with_name(pdf_path.name + ".meta.json")
-        if pdf_path.exists() and txt_path.exists() and meta_path.exists() and not force:
-            continue
-        print(f"⬇️  Downloading {url} -> {pdf_path}")
-        ok, status_code, content_type, headers, final_url = save_binary(url, pdf_path)
-        if not ok:
-            print(f"⚠️  Skipping (status={status_code} ctype='{content_type}') for {url}")
+                    print(f"⚠️  Failed writing failure meta for {url}: {e}")
+                record_debug_event({
+                    "event": "download_failed",
+                    "source": source,
+                    "year": year,
+                    "url": url,
+                    "status_code": status_code,
+                    "content_type": content_type,
+                    "final_url": final_url,
+                    "policy": policy,
+                })
+                return 0, 0
             try:
-                if pdf_path.exists():
-                    pdf_path.unlink()
-            except Exception:
-                pass
-            failure_meta = dict(it)
-            failure_meta.update({
-                "saved_at": datetime.now().isoformat(),
-                "status_code": status_code,
-                "content_type": content_type,
-                "headers": headers,
-                "final_url": final_url,
-                "failure_stage": "download",
-                "failure_reason": "non_pdf_response" if "pdf" not in (content_type or "").lower() else "http_error",
-            })
-            try:
-                meta_path.write_text(json.dumps(failure_meta, indent=2), encoding="utf-8")
+                text = extract_text_cached(temp_pdf, sha256, force=force, text_pool=text_pool)
             except Exception as e:
-                print(f"⚠️  Failed writing failure meta for {pdf_path}: {e}")
-            record_debug_event({
-                "event": "download_failed",
-                "source": source,
-                "year": year,
-                "url": url,
-                "status_code": status_code,
-                "content_type": content_type,
-                "final_url": final_url,
-                "policy": policy,
-            })
-            continue
+                # Leave text and meta unwritten so the next run retries this PDF
+                print(f"⚠️  Text extraction failed for temp PDF {temp_pdf}: {e}")
+                return 0, 0
         try:
-            text = extract_text(pdf_path)
-            txt_path.write_text(text, encoding="utf-8")
+            atomic_write_text(txt_path, text)
         except Exception as e:
-            print(f"⚠️  Text extraction failed for {pdf_path}: {e}")
+            print(f"⚠️  Failed writing text for {url}: {e}")
+            return 0, 0
+
         meta = dict(it)
         meta.update({
-            "saved_path": str(pdf_path),
-            "text_path": str(txt_path),
             "saved_at": datetime.now().isoformat(),
+            "status_code": status_code,
             "content_type": content_type,
+            "content_length": (headers or {}).get("Content-Length", ""),
+            "last_modified": (headers or {}).get("Last-Modified", ""),
+            "etag": (headers or {}).get("ETag", ""),
+            "final_url": final_url,
+            "local_text_path": str(txt_path),
+        })
+        try:
+            write_json(meta_path, meta)
+        except Exception as e:
+            print(f"⚠️  Failed writing meta for {url}: {e}")
+            return 0, 0
+        print(f"✅ Parsed + discarded PDF for {source}/{year}: {fn}")
+        return 1, 0
+
+    # Download policy
+    fn = make_filename(it)
+    out_dir = FILES_DIR / source / str(year)
+    pdf_path = out_dir / fn
+    txt_path = pdf_path.with_name(pdf_path.name + ".txt")
+    meta_path = pdf_path.with_name(pdf_path.name + ".meta.json")
+    if pdf_path.exists() and txt_path.exists() and meta_path.exists() and not force:
+        return 0, 0
+    # Past the check above, a kept PDF with its meta means only the text is
+    # missing: revalidate the PDF rather than fetching it again.
+    prior = load_fetched_meta(meta_path) if pdf_path.exists() and not force else {}
+    if prior:
+        print(f"🔁 Revalidating {url} -> {pdf_path}")
+    else:
+        print(f"⬇️  Downloading {url} -> {pdf_path}")
+    ok, status_code, content_type, headers, final_url, sha256 = save_binary(
+        url, pdf_path, extra_headers=conditional_headers(prior)
+    )
+    if status_code == 304 and prior:
+        try:
+            text = extract_text_cached(pdf_path, file_sha256(pdf_path), text_pool=text_pool)
+            atomic_write_text(txt_path, text)
+        except Exception as e:
+            print(f"⚠️  Text extraction failed for {pdf_path}: {e}")
+            return 0, 0
+        if not refresh_unchanged_meta(meta_path, prior, it):
+            return 0, 0
+        print(f"✅ Unchanged PDF, re-extracted text for {source}/{year}: {pdf_path.name}")
+        return 0, 0
+    if not ok:
+        print(f"⚠️  Skipping (status={status_code} ctype='{content_type}') for {url}")
+        try:
+            if pdf_path.exists():
+                pdf_path.unlink()
+        except Exception:
+            pass
+        failure_meta = dict(it)
+        failure_meta.update({
+            "saved_at": datetime.now().isoformat(),
             "status_code": status_code,
-            "content_length": headers.get("Content-Length", ""),
-            "last_modified": headers.get("Last-Modified", ""),
-            "etag": headers.get("ETag", ""),
+            "content_type": content_type,
+            "headers": headers,
             "final_url": final_url,
+            "failure_stage": "download",
+            "failure_reason": "non_pdf_response" if "pdf" not in (content_type or "").lower() else "http_error",
         })
         try:
-            meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+            write_json(meta_path, failure_meta)
         except Exception as e:
-            print(f"⚠️  Failed writing meta for {pdf_path}: {e}")
-        created_downloads += 1
-        print(f"✅ Saved PDF + text for {source}/{year}: {pdf_path.name}")
-    return created_downloads, created_meta_only
+            print(f"⚠️  Failed writing failure meta for {pdf_path}: {e}")
+        record_debug_event({
+            "event": "download_failed",
+            "source": source,
+            "year": year,
+            "url": url,
+            "status_code": status_code,
+            "content_type": content_type,
+            "final_url": final_url,
+            "policy": policy,
+        })
+        return 0, 0
+    try:
+        text = extract_text_cached(pdf_path, sha256, force=force, text_pool=text_pool)
+        atomic_write_text(txt_path, text)
+    except Exception as e:
+        print(f"⚠️  Text extraction failed for {pdf_path}: {e}")
+    meta = dict(it)
+    meta.update({
+        "saved_path": str(pdf_path),
+        "text_path": str(txt_path),
+        "saved_at": datetime.now().isoformat(),
+        "content_type": content_type,
+        "status_code": status_code,
+        "content_length": headers.get("Content-Length", ""),
+        "last_modified": headers.get("Last-Modified", ""),
+        "etag": headers.get("ETag", ""),
+        "final_url": final_url,
+    })
+    try:
+        write_json(meta_path, meta)
+    except Exception as e:
+        print(f"⚠️  Failed writing meta for {pdf_path}: {e}")
+    print(f"✅ Saved PDF + text for {source}/{year}: {pdf_path.name}")
+    return 1, 0
+
+
+def process_file(
+    raw: RawFile,
+    policy_map: dict[str, str],
+    force: bool = False,
+    workers: int = 1,
+    text_pool: Optional[TextExtractionPool] = None,
+) -> tuple[int, int]:
+    try:
+        data = read_json(raw.path)
+    except Exception as e:
+        print(f"⚠️  Failed to read {raw.path}: {e}")
+        return 0, 0
+    items = data.get("items", [])
+    year = data.get("year") or raw.year
+    source_id = data.get("source") or raw.source
+    policy = policy_map.get(source_id, "reference_only")
+
+    meta_dir = FILES_DIR / source_id / str(year) / "meta"
+    if policy in {"reference_only", "parse_then_discard"}:
+        meta_dir.mkdir(parents=True, exist_ok=True)
+    # Items that map onto the same output files stay together and run in order,
+    # so concurrent downloads never write the same path and later duplicates
+    # still see what earlier ones saved. Keyed case-insensitively for macOS.
+    groups: dict[str, List[dict]] = {}
+    for it in items:
+        if is_pdf_like(it.get("url") or ""):
+            groups.setdefault(meta_filename(it).lower(), []).append(it)
+
+    def run_group(group: List[dict]) -> tuple[int, int]:
+        downloads = meta_only = 0
+        for it in group:
+            dl, mo = process_item(it, source_id, year, policy, meta_dir, force=force, text_pool=text_pool)
+            downloads += dl
+            meta_only += mo
+        return downloads, meta_only
+
+    if workers <= 1 or len(groups) <= 1:
+        results = list(map(run_group, groups.values()))
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(groups))) as pool:
+            results = list(pool.map(run_group, groups.values()))
+    return sum(dl for dl, _ in results), sum(mo for _, mo in results)
 
 
 def process_single_pdf(pdf_path: Path, force: bool = False) -> int:
@@ -462,7 +798,7 @@ def process_single_pdf(pdf_path: Path, force: bool = False) -> int:
         return 1
 
     try:
-        txt_path.write_text(text, encoding="utf-8")
+        atomic_write_text(txt_path, text)
     except Exception as exc:
         print(f"⚠️  Failed writing text to {txt_path}: {exc}")
         return 1
@@ -478,6 +814,8 @@ def main(argv: Optional[List[str]] = None) -> int:
     group.add_argument("--file", help="Process a single local PDF file", default=None)
     ap.add_argument("--year", help="Limit to a single year (YYYY)", default=None)
     ap.add_argument("--force", action="store_true", help="Re-download and re-extract even if files exist")
+    ap.add_argument("--workers", type=int, default=DOWNLOAD_WORKERS, help=f"Concurrent downloads (default: {DOWNLOAD_WORKERS})")
+    ap.add_argument("--text-workers", type=int, default=None, help="Processes for PDF text extraction (default: CPU count)")
     args = ap.parse_args(argv)
 
     if args.file:
@@ -489,11 +827,19 @@ def main(argv: Optional[List[str]] = None) -> int:
     total_meta = 0
     found_any = False
     policy_map = load_artifact_policy()
-    for rf in iter_raw_files(args.source, args.year):
-        found_any = True
-        dl, meta_only = process_file(rf, policy_map, force=args.force)
-        total_dl += dl
-        total_meta += meta_only
+    # Parsing is CPU-bound; only worth a process pool when downloads overlap
+    text_workers = args.text_workers or os.cpu_count() or 1
+    text_pool = TextExtractionPool(text_workers) if text_workers > 1 and args.workers > 1 else None
+    try:
+        for rf in iter_raw_files(args.source, args.year):
+            found_any = True
+            dl, meta_only = process_file(rf, policy_map, force=args.force, workers=args.workers, text_pool=text_pool)
+            total_dl += dl
+            total_meta += meta_only
+    finally:
+        if text_pool is not None:
+            text_pool.shutdown()
+        close_debug_log()
     if not found_any:
         print("⚠️  No raw files found under outputs/raw")
         return 1
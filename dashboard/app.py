@@ -4,6 +4,7 @@ JaxWatch Document Verifier Local Admin Dashboard
 A read-only-first, CRM-style interface for browsing and managing projects
 """
 
+import heapq
 import json
 import os
 import sys
@@ -67,12 +68,11 @@ def index():
         # Enhanced recent activity
         recent_enhanced = []
         if enriched_projects:
-            sorted_projects = sorted(
+            recent_enhanced = heapq.nlargest(
+                5,
                 enriched_projects,
                 key=lambda p: p.get('document_verification', {}).get('processed_at', ''),
-                reverse=True
-            )[:5]
-            recent_enhanced = sorted_projects
+            )
 
         # Active jobs
         active_jobs = [job for job in active_dashboard_jobs.values() if job['status'] == 'running']
@@ -129,11 +129,12 @@ def projects():
         projects = []
         for project in raw_projects:
             project_data = project.copy()
-            project_data['has_enhancement'] = project['id'] in enriched_lookup
-            if project_data['has_enhancement']:
-                enhanced = enriched_lookup[project['id']]
-                project_data['processed_at'] = enhanced.get('document_verification', {}).get('processed_at')
-                project_data['enhancement_version'] = enhanced.get('document_verification', {}).get('version')
+            enhanced = enriched_lookup.get(project['id'])
+            project_data['has_enhancement'] = enhanced is not None
+            if enhanced is not None:
+                verification = enhanced.get('document_verification') or {}
+                project_data['processed_at'] = verification.get('processed_at')
+                project_data['enhancement_version'] = verification.get('version')
             projects.append(project_data)
 
         # Apply filters
@@ -143,9 +144,10 @@ def projects():
         sort_by = request.args.get('sort', 'title')
 
         if search:
+            needle = search.lower()
             projects = [p for p in projects if
-                       search.lower() in p.get('title', '').lower() or
-                       search.lower() in p.get('id', '').lower()]
+                       needle in p.get('title', '').lower() or
+                       needle in p.get('id', '').lower()]
 
         if filter_enhanced == 'yes':
             projects = [p for p in projects if p['has_enhancement']]
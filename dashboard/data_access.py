@@ -3,6 +3,7 @@ Data access utilities for JaxWatch Dashboard
 Handles reading/writing JSON files on disk
 """
 
+import heapq
 import json
 from pathlib import Path
 from typing import List, Dict, Optional
@@ -149,15 +150,13 @@ def get_recent_activity(limit: int = 10) -> List[Dict]:
     """Get recently processed projects."""
     enriched_projects = load_enriched_projects()
 
-    # Sort by processed_at timestamp
-    sorted_projects = sorted(
+    # Newest by processed_at timestamp; nlargest avoids sorting the full list for a short page
+    return heapq.nlargest(
+        limit,
         enriched_projects,
         key=lambda p: p.get('document_verification', {}).get('processed_at', ''),
-        reverse=True
     )
 
-    return sorted_projects[:limit]
-
 
 def load_reference_scanner_annotations_for_project(project: Dict) -> List[Dict]:
     """
@@ -5,6 +5,7 @@ Coordinates document verification and reference scanning for projects.
 """
 
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -280,13 +281,9 @@ class ProjectEnrichmentPipeline:
             }
 
             # Calculate reference types
-            reference_types = {}
-            for project in enriched_projects:
-                for ref in project.references:
-                    ref_type = ref.type
-                    reference_types[ref_type] = reference_types.get(ref_type, 0) + 1
+            reference_types = Counter(ref.type for p in enriched_projects for ref in p.references)
 
-            stats['reference_types'] = reference_types
+            stats['reference_types'] = dict(reference_types)
 
             return stats
 
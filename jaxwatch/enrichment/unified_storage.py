@@ -5,6 +5,7 @@ Manages storage of enriched project data in a unified format.
 """
 
 import json
+from collections import Counter
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
@@ -164,9 +165,7 @@ class UnifiedEnrichmentStorage:
             summary['last_updated'] = most_recent.isoformat()
 
         # Count project types
-        for project in enriched_projects:
-            doc_type = project.project.doc_type
-            summary['project_types'][doc_type] = summary['project_types'].get(doc_type, 0) + 1
+        summary['project_types'] = dict(Counter(p.project.doc_type for p in enriched_projects))
 
         # Calculate verification stats
         total_verifications = 0